@@ -21,6 +21,7 @@ class Settings(BaseSettings):
     scrape_schedule: str = "0 8 * * 1"
     openai_api_key: str = ""
     openai_model: str = "gpt-4o-mini"
+    openai_concurrency: int = 4
     telegram_bot_token: str = ""
     telegram_channel_id: str = ""
     google_calendar_id: str = ""
@@ -31,6 +32,7 @@ class Settings(BaseSettings):
     admin_password: str = ""
     hetzner_api_key: str = ""
     scrape_detail_concurrency: int = 5
+    scrape_detail_host_concurrency: int = 2
     scrape_detail_timeout: int = 15
 
     @field_validator("secret_key")
@@ -1,45 +1,77 @@
 from collections.abc import Generator
 
+from sqlalchemy import event
 from sqlmodel import Session, SQLModel, create_engine
 
 from app.config import get_settings
 
+# WAL lets the API keep reading while a scrape writes; NORMAL sync is safe under WAL
+SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+)
+
+
+def _set_sqlite_pragmas(dbapi_connection, connection_record) -> None:
+    cursor = dbapi_connection.cursor()
+    for pragma in SQLITE_PRAGMAS:
+        cursor.execute(pragma)
+    cursor.close()
+
 
 def get_engine(database_url: str | None = None):
     url = database_url or get_settings().database_url
-    connect_args = {"check_same_thread": False} if url.startswith("sqlite") else {}
-    return create_engine(url, connect_args=connect_args)
+    if url.startswith("sqlite"):
+        engine = create_engine(url, connect_args={"check_same_thread": False})
+        event.listen(engine, "connect", _set_sqlite_pragmas)
+        return engine
+    # Server databases: keep a warm pool and drop connections the server closed
+    return create_engine(url, pool_size=20, max_overflow=10, pool_pre_ping=True)
 
 
 def init_db(engine):
     SQLModel.metadata.create_all(engine)
 
 
+# Columns added after the first release: (name, column definition)
+EVENT_MIGRATION_COLUMNS = [
+    ("speakers", "TEXT DEFAULT '[]'"),
+    ("organizer", "TEXT"),
+    ("image_url", "TEXT"),
+    ("reminder_sent", "BOOLEAN DEFAULT 0"),
+]
+
+# Indexes added after the first release (create_all skips existing tables)
+EVENT_MIGRATION_INDEXES = [
+    ("ix_event_date", "date"),
+    ("ix_event_scraped_at", "scraped_at"),
+]
+
+
 def migrate_db(engine):
-    """Add missing columns to existing tables (SQLite ALTER TABLE)."""
+    """Add missing columns to existing tables (SQLite ALTER TABLE).
+
+    All pending columns and indexes are added in one transaction; nothing
+    is opened when the schema is already up to date.
+    """
     import sqlalchemy
 
     inspector = sqlalchemy.inspect(engine)
     columns = {c["name"] for c in inspector.get_columns("event")}
+    indexes = {i["name"] for i in inspector.get_indexes("event")}
+    pending = [(name, ddl) for name, ddl in EVENT_MIGRATION_COLUMNS if name not in columns]
+    pending_indexes = [
+        (name, cols) for name, cols in EVENT_MIGRATION_INDEXES if name not in indexes
+    ]
+    if not pending and not pending_indexes:
+        return
     with engine.begin() as conn:
-        if "speakers" not in columns:
-            conn.execute(
-                sqlalchemy.text('ALTER TABLE event ADD COLUMN speakers TEXT DEFAULT "[]"')
-            )
-        if "organizer" not in columns:
-            conn.execute(
-                sqlalchemy.text("ALTER TABLE event ADD COLUMN organizer TEXT")
-            )
-        if "image_url" not in columns:
-            conn.execute(
-                sqlalchemy.text("ALTER TABLE event ADD COLUMN image_url TEXT")
-            )
-        if "reminder_sent" not in columns:
-            conn.execute(
-                sqlalchemy.text(
-                    "ALTER TABLE event ADD COLUMN reminder_sent BOOLEAN DEFAULT 0"
-                )
-            )
+        for name, ddl in pending:
+            conn.execute(sqlalchemy.text(f"ALTER TABLE event ADD COLUMN {name} {ddl}"))
+        for name, cols in pending_indexes:
+            conn.execute(sqlalchemy.text(f"CREATE INDEX IF NOT EXISTS {name} ON event ({cols})"))
 
 
 def get_session(engine) -> Generator[Session, None, None]:
@@ -1,16 +1,34 @@
 import asyncio
-import json
 import logging
+import re
+from collections import defaultdict
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from functools import lru_cache
+from urllib.parse import urlparse
 
 import httpx
-from bs4 import BeautifulSoup
-from markdownify import markdownify
+import orjson
+from bs4 import BeautifulSoup, NavigableString, SoupStrainer
+from markdownify import MarkdownConverter
 
 from app.config import get_settings
 
 log = logging.getLogger(__name__)
 
 MARKDOWN_MAX_CHARS = 3000
+# Page content is cut after this much visible text before markdownify runs;
+# markdown never comes out shorter than the text it was made from
+HTML_TEXT_MAX_CHARS = MARKDOWN_MAX_CHARS
+
+# Reused across pages; MarkdownConverter caches its per-tag converter lookups
+_MARKDOWN_CONVERTER = MarkdownConverter()
+
+_JSON_LD_ATTRS = {"type": "application/ld+json"}
+_OG_META_ATTRS = {"property": True}
+
+# Elements stripped from page content before markdown conversion
+NOISE_TAGS = ["nav", "footer", "header", "script", "style"]
 
 # Domains known to block scrapers
 BLOCKED_DOMAINS = {"linkedin.com", "www.linkedin.com"}
@@ -18,12 +36,147 @@ BLOCKED_DOMAINS = {"linkedin.com", "www.linkedin.com"}
 # Signals that a page is a login/block page rather than real content
 BLOCKED_TITLE_KEYWORDS = ["login", "sign in", "log in", "přihlásit", "captcha", "verify"]
 
+# Pages without JSON-LD and with less body text than this are treated as blocked
+BLOCKED_MIN_BODY_CHARS = 200
+
 # Event platforms to prioritize in search results (sorted first)
 PREFERRED_DOMAINS = {"luma.com", "meetup.com", "eventbrite.com", "lu.ma", "allevents.in", "konfeo.com"}
 
+_BLOCKED_SUFFIXES = tuple(BLOCKED_DOMAINS)
+_PREFERRED_SUFFIXES = tuple(PREFERRED_DOMAINS)
+_BLOCKED_TITLE_RE = re.compile("|".join(map(re.escape, BLOCKED_TITLE_KEYWORDS)))
+
+
+def _has_text(element, min_chars: int) -> bool:
+    """Whether the element has at least ``min_chars`` of stripped text.
+
+    Stops walking the tree as soon as the threshold is reached instead of
+    joining the whole text like ``get_text(strip=True)`` would.
+    """
+    total = 0
+    for text in element.stripped_strings:
+        total += len(text)
+        if total >= min_chars:
+            return True
+    return False
+
+
+def _truncate_text(element, max_chars: int) -> None:
+    """Cut the element's visible text to ``max_chars`` stripped chars in place.
+
+    Comments and other non-text strings are not counted. The string that
+    crosses the budget is shortened and every node after it is removed, so
+    the remaining tree stays well-formed however much markup surrounds the
+    text.
+    """
+    total = 0
+    for text in element.find_all(string=True):
+        if type(text) is not NavigableString:
+            continue
+        stripped = len(text.strip())
+        if total + stripped >= max_chars:
+            break
+        total += stripped
+    else:
+        return
+
+    lead = len(text) - len(text.lstrip())
+    node = NavigableString(text[: lead + max_chars - total])
+    text.replace_with(node)
+    while node is not element:
+        for sibling in list(node.next_siblings):
+            sibling.extract()
+        node = node.parent
+
+
+@lru_cache(maxsize=1024)
+def _domain_blocked(netloc: str) -> bool:
+    return netloc.endswith(_BLOCKED_SUFFIXES)
+
+
+# Only these tags (and their subtrees) are ever read from a detail page
+PAGE_STRAINER = SoupStrainer(
+    ["script", "meta", "title", "main", "article", "body", "nav", "footer", "header", "style"]
+)
+
+
+def _parse_html(content: bytes) -> BeautifulSoup:
+    """Parse raw page bytes with lxml, falling back to html.parser on failure."""
+    try:
+        return BeautifulSoup(content, "lxml", parse_only=PAGE_STRAINER)
+    except Exception:
+        log.debug("lxml failed to parse page, falling back to html.parser", exc_info=True)
+        return BeautifulSoup(content, "html.parser", parse_only=PAGE_STRAINER)
+
+
+def _web_search(query: str) -> list[dict]:
+    """Blocking DuckDuckGo text search."""
+    from ddgs import DDGS
+
+    with DDGS() as ddgs:
+        return ddgs.text(query, max_results=8)
+
+
+def _find_event(node):
+    """Yield JSON-LD Event objects depth-first, including ones inside @graph."""
+    if isinstance(node, dict):
+        if node.get("@type") == "Event":
+            yield node
+        for value in node.values():
+            yield from _find_event(value)
+    elif isinstance(node, list):
+        for item in node:
+            yield from _find_event(item)
+
+
+# Connection pool shared by all detail page requests of one fetcher
+DETAIL_HTTP_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=20)
+
+
+class _HostLimiter:
+    """Bound concurrent requests both overall and per host.
+
+    The host slot is taken first, so requests queued behind a slow host do
+    not hold global slots that other hosts could use.
+    """
+
+    def __init__(self, total: int, per_host: int) -> None:
+        self._total = asyncio.Semaphore(total)
+        self._hosts: defaultdict[str, asyncio.Semaphore] = defaultdict(
+            lambda: asyncio.Semaphore(per_host)
+        )
+
+    @asynccontextmanager
+    async def slot(self, url: str) -> AsyncIterator[None]:
+        async with self._hosts[urlparse(url).netloc.lower()], self._total:
+            yield
+
 
 class DetailFetcher:
-    """Fetch event detail pages and extract structured data."""
+    """Fetch event detail pages and extract structured data.
+
+    The HTTP client is created lazily and kept open across ``fetch_details``
+    calls so connections are reused; call ``aclose()`` when done.
+    """
+
+    def __init__(self) -> None:
+        self._client: httpx.AsyncClient | None = None
+
+    def _get_client(self) -> httpx.AsyncClient:
+        if self._client is None or self._client.is_closed:
+            settings = get_settings()
+            self._client = httpx.AsyncClient(
+                timeout=settings.scrape_detail_timeout,
+                follow_redirects=True,
+                limits=DETAIL_HTTP_LIMITS,
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the shared HTTP client, if one was opened."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
 
     async def fetch_details(self, events: list[dict]) -> list[dict]:
         """Concurrently fetch detail pages for all events.
@@ -33,18 +186,74 @@ class DetailFetcher:
         - og_meta: OpenGraph meta tags (dict)
         - markdown: HTML body converted to markdown (truncated)
 
-        Returns enriched event dicts with these new keys.
+        Returns enriched event dicts with these new keys, in input order.
+        """
+        results: list[dict] = [{}] * len(events)
+        async for index, enriched in self.iter_details(events):
+            results[index] = enriched
+        return results
+
+    async def iter_details(
+        self, events: list[dict]
+    ) -> AsyncIterator[tuple[int, dict]]:
+        """Yield ``(index, enriched_event)`` pairs as each detail page completes.
+
+        Lets callers start processing finished pages while slower hosts are
+        still being fetched. Events sharing a URL are fetched once and the
+        detail data is copied to each of them.
+
+        Pending fetches are cancelled when the generator is closed. A bare
+        ``break`` does not close it until it is garbage-collected, so callers
+        that may stop early should iterate inside
+        ``contextlib.aclosing(fetcher.iter_details(...))``.
         """
         settings = get_settings()
-        sem = asyncio.Semaphore(settings.scrape_detail_concurrency)
-        async with httpx.AsyncClient(
-            timeout=settings.scrape_detail_timeout, follow_redirects=True
-        ) as client:
-            tasks = [self._fetch_single(event, sem, client) for event in events]
-            return await asyncio.gather(*tasks)
+        limiter = _HostLimiter(
+            settings.scrape_detail_concurrency,
+            settings.scrape_detail_host_concurrency,
+        )
+        client = self._get_client()
+        # Search results memoized for this run only, so stale or failed
+        # answers are not reused by later scrapes
+        searches: dict[str, list[dict]] = {}
+
+        by_url: dict[str, list[int]] = {}
+        for i, event in enumerate(events):
+            by_url.setdefault(event.get("url", ""), []).append(i)
+
+        async def _fetch_group(indices: list[int]) -> tuple[list[int], dict]:
+            event = events[indices[0]]
+            try:
+                return indices, await self._fetch_single(event, limiter, client, searches)
+            except Exception:
+                # One broken page must not abort the rest of the batch
+                log.warning("Failed to process detail page: %s", event.get("url"), exc_info=True)
+                return indices, {**event, "json_ld": None, "og_meta": {}, "markdown": ""}
+
+        tasks = [asyncio.create_task(_fetch_group(indices)) for indices in by_url.values()]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                indices, enriched = await next_done
+                yield indices[0], enriched
+                for index in indices[1:]:
+                    yield index, {
+                        **events[index],
+                        "json_ld": enriched["json_ld"],
+                        "og_meta": enriched["og_meta"],
+                        "markdown": enriched["markdown"],
+                    }
+        finally:
+            for task in tasks:
+                task.cancel()
+            # Let cancelled fetches unwind before the client can be closed
+            await asyncio.gather(*tasks, return_exceptions=True)
 
     async def _fetch_single(
-        self, event: dict, sem: asyncio.Semaphore, client: httpx.AsyncClient
+        self,
+        event: dict,
+        limiter: _HostLimiter,
+        client: httpx.AsyncClient,
+        searches: dict[str, list[dict]],
     ) -> dict:
         """Fetch and parse a single event detail page."""
         enriched = {**event, "json_ld": None, "og_meta": {}, "markdown": ""}
@@ -53,50 +262,67 @@ class DetailFetcher:
             return enriched
 
         try:
-            async with sem:
+            async with limiter.slot(url):
                 response = await client.get(url)
                 response.raise_for_status()
         except Exception:
             log.warning("Failed to fetch detail page: %s", url, exc_info=True)
             return enriched
 
-        soup = BeautifulSoup(response.text, "html.parser")
+        # Parsing is CPU-bound; run it in a worker thread so the event loop
+        # keeps dispatching the other fetches meanwhile
+        soup, json_ld = await asyncio.to_thread(self._parse_page, response.content)
 
         # Detect blocked/login pages and try web search fallback
-        if self._is_blocked(soup, url):
+        if self._is_blocked(soup, url, json_ld):
             title = event.get("title", "")
             log.info("Page blocked (%s), searching for: %s", url, title)
-            fallback_soup = await self._search_fallback(title, url, sem, client)
-            if fallback_soup:
-                soup = fallback_soup
-
-        enriched["json_ld"] = self._extract_json_ld(soup)
-        enriched["og_meta"] = self._extract_og_meta(soup)
-        enriched["markdown"] = self._html_to_markdown(soup)
+            fallback = await self._search_fallback(
+                title, url, limiter, client, searches
+            )
+            if fallback:
+                soup, json_ld = fallback
+
+        enriched["json_ld"] = json_ld
+        enriched["og_meta"], enriched["markdown"] = await asyncio.to_thread(
+            self._extract_content, soup
+        )
         return enriched
 
-    def _is_blocked(self, soup: BeautifulSoup, url: str) -> bool:
-        """Detect if a page is a login/captcha wall instead of real content."""
-        from urllib.parse import urlparse
+    def _parse_page(self, content: bytes) -> tuple[BeautifulSoup, dict | None]:
+        """Parse a fetched page and pull out its JSON-LD Event."""
+        soup = _parse_html(content)
+        return soup, self._extract_json_ld(soup)
+
+    def _extract_content(self, soup: BeautifulSoup) -> tuple[dict, str]:
+        """OpenGraph tags and markdown body of a parsed page."""
+        return self._extract_og_meta(soup), self._html_to_markdown(soup)
 
+    def _is_blocked(
+        self, soup: BeautifulSoup, url: str, json_ld: dict | None
+    ) -> bool:
+        """Detect if a page is a login/captcha wall instead of real content.
+
+        ``json_ld`` is the already-extracted JSON-LD Event of the page, if any,
+        so the scripts are not parsed a second time.
+        """
         # Known blocked domains
         domain = urlparse(url).netloc.lower()
-        if any(domain.endswith(bd) for bd in BLOCKED_DOMAINS):
+        if _domain_blocked(domain):
             return True
 
         # Check page title for block signals
         title_tag = soup.find("title")
         if title_tag:
             title_text = title_tag.get_text().lower()
-            if any(kw in title_text for kw in BLOCKED_TITLE_KEYWORDS):
+            if _BLOCKED_TITLE_RE.search(title_text):
                 return True
 
         # No JSON-LD Event data + very short body = likely blocked
-        has_json_ld = self._extract_json_ld(soup) is not None
-        body = soup.find("body")
-        body_text_len = len(body.get_text(strip=True)) if body else 0
-        if not has_json_ld and body_text_len < 200:
-            return True
+        if json_ld is None:
+            body = soup.find("body")
+            if not body or not _has_text(body, BLOCKED_MIN_BODY_CHARS):
+                return True
 
         return False
 
@@ -104,18 +330,17 @@ class DetailFetcher:
         self,
         title: str,
         original_url: str,
-        sem: asyncio.Semaphore,
+        limiter: _HostLimiter,
         client: httpx.AsyncClient,
-    ) -> BeautifulSoup | None:
+        searches: dict[str, list[dict]],
+    ) -> tuple[BeautifulSoup, dict | None] | None:
         """Search for event by title and scrape the best alternative page.
 
         Prioritizes pages with JSON-LD Event data (luma.com, meetup.com, etc.)
-        over generic pages.
+        over generic pages. Returns the parsed page with its JSON-LD Event.
+        Non-empty search results are stored in ``searches`` by query.
         """
         try:
-            from ddgs import DDGS
-            from urllib.parse import urlparse
-
             original_domain = urlparse(original_url).netloc.lower()
 
             # Try exact title first, then broader query
@@ -123,37 +348,41 @@ class DetailFetcher:
             candidates: list[tuple[BeautifulSoup, str]] = []
 
             for query in queries:
-                with DDGS() as ddgs:
-                    results = list(ddgs.text(query, max_results=8))
+                results = searches.get(query)
+                if results is None:
+                    # DDGS is synchronous; keep it off the event loop
+                    results = await asyncio.to_thread(_web_search, query)
+                    if results:
+                        searches[query] = results
 
                 # Sort: preferred event platforms first
                 def _domain_priority(r):
                     domain = urlparse(r.get("href", "")).netloc.lower()
-                    return 0 if any(domain.endswith(pd) for pd in PREFERRED_DOMAINS) else 1
-
-                results.sort(key=_domain_priority)
+                    return 0 if domain.endswith(_PREFERRED_SUFFIXES) else 1
 
-                for result in results:
+                for result in sorted(results, key=_domain_priority):
                     alt_url = result.get("href", "")
                     alt_domain = urlparse(alt_url).netloc.lower()
 
                     if alt_domain == original_domain:
                         continue
-                    if any(alt_domain.endswith(bd) for bd in BLOCKED_DOMAINS):
+                    if _domain_blocked(alt_domain):
                         continue
 
                     log.info("Trying fallback URL: %s", alt_url)
                     try:
-                        async with sem:
+                        async with limiter.slot(alt_url):
                             resp = await client.get(alt_url)
                             resp.raise_for_status()
-                        alt_soup = BeautifulSoup(resp.text, "html.parser")
-                        if self._is_blocked(alt_soup, alt_url):
+                        alt_soup, alt_json_ld = await asyncio.to_thread(
+                            self._parse_page, resp.content
+                        )
+                        if self._is_blocked(alt_soup, alt_url, alt_json_ld):
                             continue
                         # Best case: page has JSON-LD Event data — use immediately
-                        if self._extract_json_ld(alt_soup):
+                        if alt_json_ld:
                             log.info("Fallback with JSON-LD found: %s", alt_url)
-                            return alt_soup
+                            return alt_soup, alt_json_ld
                         candidates.append((alt_soup, alt_url))
                     except Exception:
                         log.debug("Fallback URL failed: %s", alt_url, exc_info=True)
@@ -164,7 +393,7 @@ class DetailFetcher:
                 if candidates:
                     best_soup, best_url = candidates[0]
                     log.info("Fallback (no JSON-LD): %s", best_url)
-                    return best_soup
+                    return best_soup, None
 
             log.warning("No fallback found for: %s", title)
         except Exception:
@@ -173,37 +402,25 @@ class DetailFetcher:
 
     def _extract_json_ld(self, soup: BeautifulSoup) -> dict | None:
         """Extract first Event-type JSON-LD from <script type='application/ld+json'>."""
-        for script in soup.select('script[type="application/ld+json"]'):
+        for script in soup.find_all("script", attrs=_JSON_LD_ATTRS):
             try:
-                data = json.loads(script.string or "")
-            except (json.JSONDecodeError, TypeError):
+                data = orjson.loads(str(script.string or ""))
+            except orjson.JSONDecodeError:
                 continue
 
-            # Direct Event object
-            if isinstance(data, dict) and data.get("@type") == "Event":
-                return data
-
-            # @graph array
-            if isinstance(data, dict) and "@graph" in data:
-                for item in data["@graph"]:
-                    if isinstance(item, dict) and item.get("@type") == "Event":
-                        return item
-
-            # Top-level array
-            if isinstance(data, list):
-                for item in data:
-                    if isinstance(item, dict) and item.get("@type") == "Event":
-                        return item
+            event = next(_find_event(data), None)
+            if event is not None:
+                return event
 
         return None
 
     def _extract_og_meta(self, soup: BeautifulSoup) -> dict:
         """Extract OpenGraph meta tags (og:title, og:description, og:image, etc.)."""
         result = {}
-        for meta in soup.select('meta[property^="og:"]'):
+        for meta in soup.find_all("meta", attrs=_OG_META_ATTRS):
             prop = meta.get("property", "")
             content = meta.get("content", "")
-            if prop and content:
+            if prop.startswith("og:") and content:
                 result[prop] = content
         return result
 
@@ -216,10 +433,13 @@ class DetailFetcher:
         if not content_el:
             return ""
 
-        # Remove noise elements
-        for tag_name in ("nav", "footer", "header", "script", "style"):
-            for tag in content_el.find_all(tag_name):
+        # Remove noise elements in a single tree walk; nested matches are
+        # already gone once their ancestor has been decomposed
+        for tag in content_el.find_all(NOISE_TAGS):
+            if not tag.decomposed:
                 tag.decompose()
 
-        md = markdownify(str(content_el))
+        _truncate_text(content_el, HTML_TEXT_MAX_CHARS)
+
+        md = _MARKDOWN_CONVERTER.convert(str(content_el))
         return md[:MARKDOWN_MAX_CHARS]
@@ -1,7 +1,9 @@
-import json
+import asyncio
 import logging
+import sys
 
 import httpx
+import orjson
 from tenacity import retry, stop_after_attempt, wait_exponential
 
 from app.config import get_settings
@@ -10,6 +12,49 @@ log = logging.getLogger(__name__)
 
 OPENAI_API_URL = "https://api.openai.com/v1/chat/completions"
 
+# Events per LLM request; how many requests run at once is openai_concurrency
+EXTRACT_BATCH_SIZE = 20
+
+
+# Kept open between scrape runs so the OpenAI connection is reused
+_client: httpx.AsyncClient | None = None
+
+
+def get_openai_client() -> httpx.AsyncClient:
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            timeout=60,
+            limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
+        )
+    return _client
+
+
+async def close_openai_client() -> None:
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+
+# Short categorical fields whose values repeat across events in a batch
+INTERNED_FIELDS = ("location", "type", "level", "language", "organizer")
+
+
+def _intern(value):
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+def _intern_event(event: dict) -> dict:
+    """Intern repeated strings in an extracted event so equal values share one object."""
+    for key in INTERNED_FIELDS:
+        if key in event:
+            event[key] = _intern(event[key])
+    for key in ("topics", "speakers"):
+        if isinstance(event.get(key), list):
+            event[key] = [_intern(v) for v in event[key]]
+    return event
+
 
 class EventExtractor:
     """Extract structured data using OpenAI LLM."""
@@ -29,7 +74,7 @@ in JSON-LD (startDate/endDate), in the markdown content, or in the title/descrip
 Use full ISO 8601 datetime format like "2026-03-15T18:00:00". If only a date is known
 without a specific time, use T09:00:00 as default start time.
 
-Return a JSON array with objects containing:
+Return a JSON object {{"events": [...]}} whose "events" array holds objects containing:
 - title: string
 - date: ISO 8601 datetime string with time (e.g. "2026-03-15T18:00:00") or null
 - end_date: ISO 8601 datetime string with time or null
@@ -47,14 +92,39 @@ Return a JSON array with objects containing:
 Events to analyze:
 {events}
 
-Return ONLY valid JSON array, no markdown."""
+Return ONLY the JSON object, no markdown."""
 
-    @retry(stop=stop_after_attempt(3), wait=wait_exponential(min=2, max=30))
     async def extract(self, events: list[dict]) -> list[dict]:
+        """Extract structured events, sending them to the LLM in parallel batches.
+
+        Each batch of ``EXTRACT_BATCH_SIZE`` events is one request and is
+        retried on its own, so a failure does not redo the whole run.
+        """
         settings = get_settings()
         if not settings.openai_api_key:
             log.warning("OpenAI API key not set, using fallback extraction from structured data")
-            return [self._extract_from_structured_data(e) for e in events]
+            return [_intern_event(self._extract_from_structured_data(e)) for e in events]
+
+        batches = [
+            events[i : i + EXTRACT_BATCH_SIZE]
+            for i in range(0, len(events), EXTRACT_BATCH_SIZE)
+        ]
+        sem = asyncio.Semaphore(settings.openai_concurrency)
+
+        client = get_openai_client()
+
+        async def _run(batch: list[dict]) -> list[dict]:
+            async with sem:
+                return await self._extract_batch(batch, client)
+
+        results = await asyncio.gather(*(_run(batch) for batch in batches))
+        return [event for batch in results for event in batch]
+
+    @retry(stop=stop_after_attempt(3), wait=wait_exponential(min=2, max=30))
+    async def _extract_batch(
+        self, events: list[dict], client: httpx.AsyncClient
+    ) -> list[dict]:
+        settings = get_settings()
 
         # Format enriched payload for LLM
         formatted = []
@@ -70,31 +140,33 @@ Return ONLY valid JSON array, no markdown."""
                 }
             )
 
-        async with httpx.AsyncClient(timeout=60) as client:
-            response = await client.post(
-                OPENAI_API_URL,
-                headers={"Authorization": f"Bearer {settings.openai_api_key}"},
-                json={
-                    "model": settings.openai_model,
-                    "messages": [
-                        {
-                            "role": "user",
-                            "content": self.PROMPT.format(
-                                events=json.dumps(formatted, ensure_ascii=False)
-                            ),
-                        }
-                    ],
-                    "temperature": 0.1,
-                },
-            )
-            response.raise_for_status()
-            content = response.json()["choices"][0]["message"]["content"]
-
-            # Clean markdown code fences if present
-            if content.startswith("```"):
-                content = content.split("\n", 1)[1].rsplit("```", 1)[0]
+        response = await client.post(
+            OPENAI_API_URL,
+            headers={
+                "Authorization": f"Bearer {settings.openai_api_key}",
+                "Content-Type": "application/json",
+            },
+            content=orjson.dumps({
+                "model": settings.openai_model,
+                "messages": [
+                    {
+                        "role": "user",
+                        "content": self.PROMPT.format(
+                            events=orjson.dumps(formatted).decode()
+                        ),
+                    }
+                ],
+                "temperature": 0.1,
+                "response_format": {"type": "json_object"},
+            }),
+        )
+        response.raise_for_status()
+        content = orjson.loads(response.content)["choices"][0]["message"]["content"]
 
-            return json.loads(content)
+        return [
+            _intern_event(e) if isinstance(e, dict) else e
+            for e in orjson.loads(content)["events"]
+        ]
 
     def _extract_from_structured_data(self, event: dict) -> dict:
         """Fallback: extract fields from JSON-LD and OpenGraph when no LLM is available."""
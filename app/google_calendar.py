@@ -12,6 +12,9 @@ log = logging.getLogger(__name__)
 
 SCOPES = ["https://www.googleapis.com/auth/calendar"]
 
+# Requests per batch HTTP call; Google recommends staying at or below 50
+GCAL_BATCH_SIZE = 50
+
 
 def _get_service():
     settings = get_settings()
@@ -45,17 +48,33 @@ def _event_to_gcal_body(event: Event) -> dict:
     return body
 
 
-def _find_existing_event(service, calendar_id: str, external_id: str) -> str | None:
-    result = service.events().list(
-        calendarId=calendar_id,
-        privateExtendedProperty=f"datatalk_external_id={external_id}",
-        maxResults=1,
-    ).execute()
-    items = result.get("items", [])
-    return items[0]["id"] if items else None
+def _list_synced_event_ids(service, calendar_id: str) -> dict[str, str]:
+    """Map datatalk external IDs to Google Calendar event IDs in one paged listing."""
+    synced: dict[str, str] = {}
+    page_token = None
+    while True:
+        result = service.events().list(
+            calendarId=calendar_id,
+            maxResults=2500,
+            pageToken=page_token,
+            fields="nextPageToken,items(id,extendedProperties/private)",
+        ).execute()
+        for item in result.get("items", []):
+            private = item.get("extendedProperties", {}).get("private", {})
+            external_id = private.get("datatalk_external_id")
+            if external_id:
+                synced[external_id] = item["id"]
+        page_token = result.get("nextPageToken")
+        if not page_token:
+            return synced
 
 
 def sync_events_to_google_calendar(events: list[Event]) -> int:
+    """Upsert events into Google Calendar using batched API requests.
+
+    Inserts and updates are sent ``GCAL_BATCH_SIZE`` at a time in one HTTP
+    round-trip each; a failure is logged per event and does not stop the rest.
+    """
     settings = get_settings()
     if not settings.google_calendar_id or not settings.google_service_account_json:
         log.warning("Google Calendar not configured, skipping sync")
@@ -63,23 +82,31 @@ def sync_events_to_google_calendar(events: list[Event]) -> int:
 
     service = _get_service()
     calendar_id = settings.google_calendar_id
+    existing_ids = _list_synced_event_ids(service, calendar_id)
+    # One request per external ID; a later duplicate wins, as a re-upsert would
+    unique_events = list({event.external_id: event for event in events}.values())
     synced = 0
 
-    for event in events:
-        body = _event_to_gcal_body(event)
-        existing_id = _find_existing_event(service, calendar_id, event.external_id)
-
-        if existing_id:
-            service.events().update(
-                calendarId=calendar_id, eventId=existing_id, body=body
-            ).execute()
-            log.debug(f"Updated GCal event: {event.title}")
+    def _on_response(request_id, response, exception) -> None:
+        nonlocal synced
+        if exception is not None:
+            log.error(f"GCal sync failed for {request_id}: {exception}")
         else:
-            service.events().insert(
-                calendarId=calendar_id, body=body
-            ).execute()
-            log.debug(f"Created GCal event: {event.title}")
-        synced += 1
+            synced += 1
+
+    for start in range(0, len(unique_events), GCAL_BATCH_SIZE):
+        batch = service.new_batch_http_request(callback=_on_response)
+        for event in unique_events[start : start + GCAL_BATCH_SIZE]:
+            body = _event_to_gcal_body(event)
+            existing_id = existing_ids.get(event.external_id)
+            if existing_id:
+                request = service.events().update(
+                    calendarId=calendar_id, eventId=existing_id, body=body
+                )
+            else:
+                request = service.events().insert(calendarId=calendar_id, body=body)
+            batch.add(request, request_id=event.external_id)
+        batch.execute()
 
     log.info(f"Synced {synced} events to Google Calendar")
     return synced
@@ -1,4 +1,5 @@
-from datetime import timedelta
+from datetime import datetime, timedelta
+from functools import lru_cache
 
 from icalendar import Calendar, Event as ICalEvent
 
@@ -6,23 +7,43 @@ from app.models import Event
 
 
 def event_to_ical(event: Event) -> bytes:
+    return _render_ical(
+        event.title,
+        event.date,
+        event.end_date,
+        event.location,
+        event.description,
+        event.url,
+    )
+
+
+@lru_cache(maxsize=512)
+def _render_ical(
+    title: str,
+    date: datetime | None,
+    end_date: datetime | None,
+    location: str | None,
+    description: str | None,
+    url: str,
+) -> bytes:
+    """Build the .ics payload; memoized on the fields it is rendered from."""
     cal = Calendar()
     cal.add("prodid", "-//DataTalk Events//datatalk.cz//")
     cal.add("version", "2.0")
 
     ical_event = ICalEvent()
-    ical_event.add("summary", event.title)
-    if event.date:
-        ical_event.add("dtstart", event.date)
-        if event.end_date:
-            ical_event.add("dtend", event.end_date)
+    ical_event.add("summary", title)
+    if date:
+        ical_event.add("dtstart", date)
+        if end_date:
+            ical_event.add("dtend", end_date)
         else:
-            ical_event.add("dtend", event.date + timedelta(hours=2))
-    if event.location:
-        ical_event.add("location", event.location)
-    if event.description:
-        ical_event.add("description", event.description)
-    ical_event.add("url", event.url)
+            ical_event.add("dtend", date + timedelta(hours=2))
+    if location:
+        ical_event.add("location", location)
+    if description:
+        ical_event.add("description", description)
+    ical_event.add("url", url)
 
     cal.add_component(ical_event)
     return cal.to_ical()
@@ -6,19 +6,28 @@ from datetime import datetime
 from fastapi import Depends, FastAPI, Request
 from fastapi.responses import HTMLResponse
 from fastapi.templating import Jinja2Templates
+from sqlalchemy import text
 from sqlmodel import Session, select
 
 from app.config import get_settings
 from app.database import get_engine, init_db, migrate_db
 from app.dependencies import get_db, set_engine
+from app.detail_fetcher import DetailFetcher
+from app.extractor import close_openai_client
 from app.google_calendar import get_calendar_share_link
 from app.models import Event, ScrapeRun  # noqa: F401 — ensure tables are registered
 from app.notifications.pipeline import run_scrape_and_sync, send_event_reminders
+from app.notifications.telegram import close_telegram_client
 from app.routers import admin, events
 from app.scheduler import create_scheduler
+from app.scraper import Scraper
 
 log = logging.getLogger(__name__)
 
+# Shared across scheduled scrapes so HTTP connections are reused
+_detail_fetcher = DetailFetcher()
+_scraper = Scraper()
+
 
 async def scheduled_scrape() -> None:
     from app.dependencies import _engine
@@ -27,7 +36,7 @@ async def scheduled_scrape() -> None:
         log.error("Engine not initialized, skipping scheduled scrape")
         return
     with Session(_engine) as session:
-        await run_scrape_and_sync(session)
+        await run_scrape_and_sync(session, _detail_fetcher, _scraper)
 
 
 async def scheduled_event_reminder() -> None:
@@ -42,6 +51,7 @@ async def scheduled_event_reminder() -> None:
 
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    app.state.settings = get_settings()
     engine = get_engine()
     init_db(engine)
     migrate_db(engine)
@@ -57,6 +67,10 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
 
     scheduler.shutdown(wait=False)
     log.info("Scheduler stopped")
+    await _detail_fetcher.aclose()
+    await _scraper.aclose()
+    await close_telegram_client()
+    await close_openai_client()
     engine.dispose()
 
 
@@ -95,5 +109,5 @@ async def api_status() -> dict[str, str]:
 
 @app.get("/health")
 def health(db: Session = Depends(get_db)) -> dict[str, str]:
-    db.exec(select(Event).limit(1))
+    db.connection().scalar(text("SELECT 1"))
     return {"status": "healthy", "db": "connected"}
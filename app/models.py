@@ -8,7 +8,7 @@ class Event(SQLModel, table=True):
     id: int | None = Field(default=None, primary_key=True)
     external_id: str = Field(unique=True, index=True)
     title: str
-    date: datetime | None = None
+    date: datetime | None = Field(default=None, index=True)
     end_date: datetime | None = None
     location: str | None = None
     description: str | None = None
@@ -20,7 +20,7 @@ class Event(SQLModel, table=True):
     organizer: str | None = None
     image_url: str | None = None
     reminder_sent: bool = False
-    scraped_at: datetime = Field(default_factory=datetime.utcnow)
+    scraped_at: datetime = Field(default_factory=datetime.utcnow, index=True)
 
 
 class ScrapeRunStatus(StrEnum):
@@ -1,9 +1,11 @@
-import hashlib
+import asyncio
 import json
 import logging
 from datetime import datetime, timedelta
+from hashlib import md5
 
-from sqlmodel import Session, select
+from sqlalchemy import insert
+from sqlmodel import Session, select, update
 
 from app.detail_fetcher import DetailFetcher
 from app.extractor import EventExtractor
@@ -15,6 +17,15 @@ from app.scraper import Scraper
 log = logging.getLogger(__name__)
 
 
+def _external_id(url: str) -> str:
+    """Stable event ID derived from its URL.
+
+    Stays MD5 so IDs match rows and Google Calendar entries created earlier;
+    it is not used for security.
+    """
+    return md5(url.encode(), usedforsecurity=False).hexdigest()[:16]
+
+
 def _parse_date(value: str | None) -> datetime | None:
     if not value:
         return None
@@ -36,15 +47,29 @@ def _ensure_str_or_none(value) -> str | None:
     return value
 
 
-async def run_scrape_and_sync(session: Session) -> None:
+async def run_scrape_and_sync(
+    session: Session,
+    detail_fetcher: DetailFetcher | None = None,
+    scraper: Scraper | None = None,
+) -> None:
+    """Scrape, enrich and store events, then sync them to Google Calendar.
+
+    A long-lived ``detail_fetcher`` and ``scraper`` may be passed in to reuse
+    their HTTP connections across runs; otherwise temporary ones are created
+    and closed.
+    """
     run = ScrapeRun(status=ScrapeRunStatus.RUNNING)
     session.add(run)
     session.commit()
     session.refresh(run)
 
+    owns_fetcher = detail_fetcher is None
+    owns_scraper = scraper is None
     try:
-        scraper = Scraper()
-        detail_fetcher = DetailFetcher()
+        if scraper is None:
+            scraper = Scraper()
+        if detail_fetcher is None:
+            detail_fetcher = DetailFetcher()
         extractor = EventExtractor()
 
         # 1. Scrape
@@ -63,69 +88,69 @@ async def run_scrape_and_sync(session: Session) -> None:
         # 2. LLM extraction
         enriched = await extractor.extract(enriched_raw)
 
-        # 3. Upsert events
+        # 3. Upsert events, loading already-stored ones in a single query
+        ext_ids = [_external_id(e.get("url", "")) for e in enriched]
+        existing_by_ext_id = {
+            ev.external_id: ev
+            for ev in session.exec(
+                select(Event).where(Event.external_id.in_(set(ext_ids)))
+            ).all()
+        }
+
         new_count = 0
         updated_count = 0
-        all_events: list[Event] = []
-        for e in enriched:
-            url = e.get("url", "")
-            ext_id = hashlib.md5(url.encode()).hexdigest()[:16]
-
-            topics = json.dumps(_ensure_list(e.get("topics", [])))
-            speakers = json.dumps(_ensure_list(e.get("speakers", [])))
-            organizer = _ensure_str_or_none(e.get("organizer"))
-
-            existing = session.exec(
-                select(Event).where(Event.external_id == ext_id)
-            ).first()
+        new_rows: dict[str, dict] = {}
+        # One timestamp for the whole batch; every row of this run shares it
+        scraped_at = datetime.utcnow()
+        for e, ext_id in zip(enriched, ext_ids):
+            fields = {
+                "title": e.get("title", ""),
+                "url": e.get("url", ""),
+                "date": _parse_date(e.get("date")),
+                "end_date": _parse_date(e.get("end_date")),
+                "location": e.get("location"),
+                "description": e.get("description"),
+                "topics": json.dumps(_ensure_list(e.get("topics", []))),
+                "event_type": e.get("type"),
+                "language": e.get("language"),
+                "speakers": json.dumps(_ensure_list(e.get("speakers", []))),
+                "organizer": _ensure_str_or_none(e.get("organizer")),
+                "image_url": e.get("image_url"),
+                "scraped_at": scraped_at,
+            }
+
+            existing = existing_by_ext_id.get(ext_id)
 
             if existing:
-                existing.title = e.get("title", "")
-                existing.url = url
-                existing.date = _parse_date(e.get("date"))
-                existing.end_date = _parse_date(e.get("end_date"))
-                existing.location = e.get("location")
-                existing.description = e.get("description")
-                existing.topics = topics
-                existing.event_type = e.get("type")
-                existing.language = e.get("language")
-                existing.speakers = speakers
-                existing.organizer = organizer
-                existing.image_url = e.get("image_url")
-                existing.scraped_at = datetime.utcnow()
-                all_events.append(existing)
+                for key, value in fields.items():
+                    setattr(existing, key, value)
+                updated_count += 1
+            elif ext_id in new_rows:
+                # Same URL twice in one run: the later entry wins
+                new_rows[ext_id].update(fields)
                 updated_count += 1
             else:
-                event = Event(
-                    external_id=ext_id,
-                    title=e.get("title", ""),
-                    url=url,
-                    date=_parse_date(e.get("date")),
-                    end_date=_parse_date(e.get("end_date")),
-                    location=e.get("location"),
-                    description=e.get("description"),
-                    topics=topics,
-                    event_type=e.get("type"),
-                    language=e.get("language"),
-                    speakers=speakers,
-                    organizer=organizer,
-                    image_url=e.get("image_url"),
-                )
-                session.add(event)
-                all_events.append(event)
+                new_rows[ext_id] = {"external_id": ext_id, **fields}
                 new_count += 1
+        # Updates flush as one executemany; new rows go out as a single
+        # multi-row INSERT ... RETURNING rather than one INSERT per object.
+        # The commit expires everything, so reload all events in one query.
+        session.flush()
+        event_ids = [ev.id for ev in existing_by_ext_id.values()]
+        if new_rows:
+            event_ids += session.exec(
+                insert(Event).returning(Event.id), params=list(new_rows.values())
+            ).scalars().all()
         session.commit()
-
-        for ev in all_events:
-            session.refresh(ev)
+        all_events = list(session.exec(select(Event).where(Event.id.in_(event_ids))).all())
 
         run.events_found = len(enriched)
         run.events_new = new_count
         log.info(f"Events: {new_count} new, {updated_count} updated")
 
-        # 4. Sync to Google Calendar
+        # 4. Sync to Google Calendar (blocking client, so run it off the event loop)
         try:
-            sync_events_to_google_calendar(all_events)
+            await asyncio.to_thread(sync_events_to_google_calendar, all_events)
         except Exception as exc:
             log.error(f"Google Calendar sync failed: {exc}")
 
@@ -138,6 +163,11 @@ async def run_scrape_and_sync(session: Session) -> None:
         run.error_message = str(exc)
         session.commit()
         raise
+    finally:
+        if owns_fetcher and detail_fetcher is not None:
+            await detail_fetcher.aclose()
+        if owns_scraper and scraper is not None:
+            await scraper.aclose()
 
 
 async def send_event_reminders(session: Session) -> None:
@@ -160,8 +190,11 @@ async def send_event_reminders(session: Session) -> None:
     telegram = TelegramNotifier()
     text = format_event_reminder(list(upcoming))
     if await telegram.send_to_channel(text):
-        for event in upcoming:
-            event.reminder_sent = True
+        session.exec(
+            update(Event)
+            .where(Event.id.in_([event.id for event in upcoming]))
+            .values(reminder_sent=True)
+        )
         session.commit()
         log.info(f"Sent reminder for {len(upcoming)} events starting in ~2h")
     else:
@@ -1,7 +1,10 @@
 import json
 import logging
+from functools import lru_cache
+from html import escape
 
 import httpx
+import orjson
 from tenacity import retry, stop_after_attempt, wait_exponential
 
 from app.config import get_settings
@@ -11,42 +14,81 @@ log = logging.getLogger(__name__)
 
 TELEGRAM_API_BASE = "https://api.telegram.org"
 
+# Kept open between sends so the Bot API connection is reused
+_client: httpx.AsyncClient | None = None
+
+
+def get_telegram_client() -> httpx.AsyncClient:
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            timeout=10.0,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+        )
+    return _client
+
+
+async def close_telegram_client() -> None:
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+@lru_cache(maxsize=8)
+def _cached_bot_url(token: str, method: str) -> httpx.URL:
+    return httpx.URL(f"{TELEGRAM_API_BASE}/bot{token}/{method}")
+
 
 class TelegramNotifier:
-    def _bot_url(self, method: str) -> str:
+    def __init__(self) -> None:
+        # Bound once per notifier rather than looked up on every send
         settings = get_settings()
-        return f"{TELEGRAM_API_BASE}/bot{settings.telegram_bot_token}/{method}"
+        self._token = settings.telegram_bot_token
+        self._channel_id = settings.telegram_channel_id
+
+    def _bot_url(self, method: str) -> httpx.URL:
+        return _cached_bot_url(self._token, method)
 
     @retry(stop=stop_after_attempt(3), wait=wait_exponential(min=1, max=10))
     async def send_to_channel(self, text: str) -> bool:
-        settings = get_settings()
-        if not settings.telegram_bot_token or not settings.telegram_channel_id:
+        if not self._token or not self._channel_id:
             log.warning("Telegram bot token or channel ID not set, skipping")
             return False
-        async with httpx.AsyncClient() as client:
-            resp = await client.post(
-                self._bot_url("sendMessage"),
-                json={
-                    "chat_id": settings.telegram_channel_id,
-                    "text": text,
-                    "parse_mode": "Markdown",
-                },
-            )
-            return resp.status_code == 200
+        payload = orjson.dumps(
+            {
+                "chat_id": self._channel_id,
+                "text": text,
+                "parse_mode": "HTML",
+            }
+        )
+        resp = await get_telegram_client().post(
+            self._bot_url("sendMessage"), content=payload, headers=JSON_HEADERS
+        )
+        return resp.status_code == 200
+
+
+REMINDER_HEADER = "<b>Za 2 hodiny:</b>\n\n"
+REMINDER_CARD = '<b>{title}</b>\n{time}{location}\n{speakers}{description}<a href="{url}">Vice info</a>'
 
 
 def format_event_reminder(events: list[Event]) -> str:
-    parts = []
+    """Render the channel reminder as Telegram HTML, escaping event fields."""
+    cards = []
     for e in events:
-        lines = [f"*{e.title}*"]
-        if e.date:
-            lines.append(f"Cas: {e.date.strftime('%H:%M')}")
-        lines.append(e.location or "TBD")
-        speakers_list = json.loads(e.speakers) if e.speakers else []
-        if speakers_list:
-            lines.append(f"Speakers: {', '.join(speakers_list)}")
-        if e.description:
-            lines.append(e.description[:200])
-        lines.append(f"[Vice info]({e.url})")
-        parts.append("\n".join(lines))
-    return f"*Za 2 hodiny:*\n\n" + "\n\n".join(parts)
+        # Skip JSON parsing for the common empty default
+        speakers_list = json.loads(e.speakers) if e.speakers and e.speakers != "[]" else []
+        cards.append(
+            REMINDER_CARD.format(
+                title=escape(e.title),
+                time=f"Cas: {e.date.strftime('%H:%M')}\n" if e.date else "",
+                location=escape(e.location or "TBD"),
+                speakers=f"Speakers: {escape(', '.join(speakers_list))}\n" if speakers_list else "",
+                description=f"{escape(e.description[:200])}\n" if e.description else "",
+                url=escape(e.url),
+            )
+        )
+    return REMINDER_HEADER + "\n\n".join(cards)
@@ -1,11 +1,13 @@
-import asyncio
-import json
+import hashlib
 import secrets
+from functools import lru_cache
 
+import orjson
 from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Request, status
 from fastapi.responses import HTMLResponse, RedirectResponse
 from fastapi.security import HTTPBasic, HTTPBasicCredentials
 from fastapi.templating import Jinja2Templates
+from jinja2 import Environment, FileSystemLoader
 from sqlmodel import Session, func, select
 
 from app.config import get_settings
@@ -15,31 +17,67 @@ from app.notifications.pipeline import run_scrape_and_sync
 
 router = APIRouter(prefix="/admin")
 security = HTTPBasic()
-templates = Jinja2Templates(directory="app/templates/admin")
 
+ADMIN_PAGE_SIZE = 50
+ADMIN_MAX_PAGE_SIZE = 200
+# Compiled templates stay in Jinja's in-memory cache; with auto_reload off
+# they are not re-stat'ed on every render (outside debug mode).
+templates = Jinja2Templates(
+    env=Environment(
+        loader=FileSystemLoader("app/templates/admin"),
+        autoescape=True,
+        auto_reload=get_settings().debug,
+    )
+)
 
-def _parse_json_list(value: str) -> list[str]:
-    if not value or value == "[]":
-        return []
+
+@lru_cache(maxsize=2048)
+def _parse_json_list_cached(value: str) -> tuple:
     try:
-        result = json.loads(value)
-        return result if isinstance(result, list) else []
-    except (json.JSONDecodeError, TypeError):
+        result = orjson.loads(value)
+    except orjson.JSONDecodeError:
+        return ()
+    return tuple(result) if isinstance(result, list) else ()
+
+
+def _parse_json_list(value: str) -> list[str]:
+    # Rows repeat the same topic/speaker lists, so parse each distinct string once
+    if not value or value == "[]" or not isinstance(value, str):
         return []
+    return list(_parse_json_list_cached(value))
 
 
 templates.env.filters["parse_json_list"] = _parse_json_list
 
 
-def verify_admin(credentials: HTTPBasicCredentials = Depends(security)):
-    settings = get_settings()
+def _paginate(db: Session, stmt, limit: int, offset: int) -> tuple[list, dict]:
+    """Fetch one page of ``stmt``; one extra row tells whether a next page exists."""
+    limit = max(1, min(limit, ADMIN_MAX_PAGE_SIZE))
+    offset = max(0, offset)
+    rows = db.exec(stmt.limit(limit + 1).offset(offset)).all()
+    page = {
+        "limit": limit,
+        "prev_offset": max(0, offset - limit) if offset else None,
+        "next_offset": offset + limit if len(rows) > limit else None,
+    }
+    return rows[:limit], page
+
+
+def _sha256(value: str) -> bytes:
+    return hashlib.sha256(value.encode()).digest()
+
+
+def verify_admin(request: Request, credentials: HTTPBasicCredentials = Depends(security)):
+    settings = request.app.state.settings
+    # Compare fixed-length digests so timing does not reveal the secret's length,
+    # and check both fields without short-circuiting
     username_ok = secrets.compare_digest(
-        credentials.username.encode(), settings.admin_username.encode()
+        _sha256(credentials.username), _sha256(settings.admin_username)
     )
     password_ok = secrets.compare_digest(
-        credentials.password.encode(), settings.admin_password.encode()
+        _sha256(credentials.password), _sha256(settings.admin_password)
     )
-    if not (username_ok and password_ok):
+    if not (username_ok & password_ok):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             headers={"WWW-Authenticate": "Basic"},
@@ -53,17 +91,16 @@ def dashboard(
     db: Session = Depends(get_db),
     admin: str = Depends(verify_admin),
 ):
-    total_events = db.exec(select(func.count(Event.id))).one()
-    last_event = db.exec(
-        select(Event).order_by(Event.scraped_at.desc()).limit(1)
-    ).first()
+    total_events, last_scrape = db.exec(
+        select(func.count(Event.id), func.max(Event.scraped_at))
+    ).one()
 
     return templates.TemplateResponse(
         "dashboard.html",
         {
             "request": request,
             "total_events": total_events,
-            "last_scrape": last_event.scraped_at if last_event else None,
+            "last_scrape": last_scrape,
         },
     )
 
@@ -73,24 +110,30 @@ def events_list(
     request: Request,
     db: Session = Depends(get_db),
     admin: str = Depends(verify_admin),
+    limit: int = ADMIN_PAGE_SIZE,
+    offset: int = 0,
 ):
-    events = db.exec(select(Event).order_by(Event.scraped_at.desc())).all()
+    events, page = _paginate(
+        db, select(Event).order_by(Event.scraped_at.desc()), limit, offset
+    )
     return templates.TemplateResponse(
-        "events.html", {"request": request, "events": events}
+        "events.html", {"request": request, "events": events, "page": page}
     )
 
 
-def _run_pipeline(db: Session) -> None:
-    asyncio.run(run_scrape_and_sync(db))
+async def _run_pipeline(engine) -> None:
+    """Run the pipeline on the app's event loop with its own DB session."""
+    with Session(engine) as session:
+        await run_scrape_and_sync(session)
 
 
 @router.post("/scrape")
 def trigger_scrape(
+    request: Request,
     background: BackgroundTasks,
-    db: Session = Depends(get_db),
     admin: str = Depends(verify_admin),
 ):
-    background.add_task(_run_pipeline, db)
+    background.add_task(_run_pipeline, request.app.state.engine)
     return RedirectResponse("/admin/?message=scrape_started", status_code=303)
 
 
@@ -99,8 +142,12 @@ def runs_list(
     request: Request,
     db: Session = Depends(get_db),
     admin: str = Depends(verify_admin),
+    limit: int = ADMIN_PAGE_SIZE,
+    offset: int = 0,
 ):
-    runs = db.exec(select(ScrapeRun).order_by(ScrapeRun.started_at.desc())).all()
+    runs, page = _paginate(
+        db, select(ScrapeRun).order_by(ScrapeRun.started_at.desc()), limit, offset
+    )
     return templates.TemplateResponse(
-        "runs.html", {"request": request, "runs": runs}
+        "runs.html", {"request": request, "runs": runs, "page": page}
     )
@@ -1,6 +1,4 @@
-import asyncio
-
-from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Request
 from fastapi.responses import Response
 from sqlmodel import Session, select
 
@@ -21,24 +19,32 @@ def list_events(limit: int = 20, db: Session = Depends(get_db)):
 
 
 @router.get("/events/{event_id}/ical")
-def get_event_ical(event_id: int, db: Session = Depends(get_db)):
+def get_event_ical(event_id: int, request: Request, db: Session = Depends(get_db)):
     event = db.get(Event, event_id)
     if not event:
         raise HTTPException(404, "Event not found")
+    # Every rescrape bumps scraped_at, so it versions the rendered calendar
+    etag = f'"{event_id}-{event.scraped_at.isoformat()}"'
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
     ical_data = event_to_ical(event)
     return Response(
         content=ical_data,
         media_type="text/calendar",
-        headers={"Content-Disposition": f'attachment; filename="event-{event_id}.ics"'},
+        headers={
+            "Content-Disposition": f'attachment; filename="event-{event_id}.ics"',
+            "ETag": etag,
+        },
     )
 
 
-def _run_pipeline(db: Session) -> None:
-    """Run the async pipeline in a new event loop for background tasks."""
-    asyncio.run(run_scrape_and_sync(db))
+async def _run_pipeline(engine) -> None:
+    """Run the pipeline on the app's event loop with its own DB session."""
+    with Session(engine) as session:
+        await run_scrape_and_sync(session)
 
 
 @router.post("/scrape")
-def trigger_scrape(background: BackgroundTasks, db: Session = Depends(get_db)):
-    background.add_task(_run_pipeline, db)
+def trigger_scrape(request: Request, background: BackgroundTasks):
+    background.add_task(_run_pipeline, request.app.state.engine)
     return {"success": True, "message": "Scraping started"}
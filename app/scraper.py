@@ -1,6 +1,8 @@
 import logging
+import re
 
 import httpx
+import soupsieve
 from bs4 import BeautifulSoup
 from tenacity import retry, stop_after_attempt, wait_exponential
 
@@ -8,16 +10,39 @@ from app.config import get_settings
 
 log = logging.getLogger(__name__)
 
+# Compiled once; the calendar page is parsed on every scheduled scrape
+CARD_SELECTOR = soupsieve.compile(
+    ".event-card, .event-item, article, .tribe-events-calendar-list__event"
+)
+CARD_TITLE_SELECTOR = soupsieve.compile(
+    "h2, h3, .tribe-events-calendar-list__event-title, .title"
+)
+CARD_LINK_SELECTOR = soupsieve.compile("a[href]")
+PAREN_RE = re.compile(r"\(([^)]*)\)")
+
 
 class Scraper:
     """Scrape events from DataTalk.cz"""
 
+    def __init__(self) -> None:
+        self._client: httpx.AsyncClient | None = None
+
+    def _get_client(self) -> httpx.AsyncClient:
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(timeout=30, follow_redirects=True)
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the shared HTTP client, if one was opened."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
     @retry(stop=stop_after_attempt(3), wait=wait_exponential(min=1, max=10))
     async def fetch_page(self, url: str) -> str:
-        async with httpx.AsyncClient(timeout=30, follow_redirects=True) as client:
-            response = await client.get(url)
-            response.raise_for_status()
-            return response.text
+        response = await self._get_client().get(url)
+        response.raise_for_status()
+        return response.text
 
     def parse_events(self, html: str) -> list[dict]:
         """Parse event entries from HTML.
@@ -26,11 +51,11 @@ class Scraper:
         event titles and date/location in parentheses after the link.
         Falls back to generic card-based selectors for resilience.
         """
-        soup = BeautifulSoup(html, "html.parser")
+        soup = BeautifulSoup(html, "lxml")
         events = []
 
         # Primary: <li> entries with <strong><a href="...">Title</a></strong>
-        for li in soup.select("li"):
+        for li in soup.find_all("li"):
             strong = li.find("strong")
             if not strong:
                 continue
@@ -50,12 +75,9 @@ class Scraper:
 
             # Extract date/location from parenthesized text after the link
             full_text = li.get_text(strip=True)
-            date_text = None
             # Pattern: "Title(date, location)" — extract what's in parens
-            paren_start = full_text.find("(")
-            paren_end = full_text.find(")")
-            if paren_start != -1 and paren_end != -1:
-                date_text = full_text[paren_start + 1:paren_end]
+            paren = PAREN_RE.search(full_text)
+            date_text = paren.group(1) if paren else None
 
             events.append(
                 {
@@ -70,14 +92,9 @@ class Scraper:
             return events
 
         # Fallback: generic card-based selectors
-        for card in soup.select(
-            ".event-card, .event-item, article, "
-            ".tribe-events-calendar-list__event"
-        ):
-            title_el = card.select_one(
-                "h2, h3, .tribe-events-calendar-list__event-title, .title"
-            )
-            link_el = card.select_one("a[href]")
+        for card in CARD_SELECTOR.select(soup):
+            title_el = CARD_TITLE_SELECTOR.select_one(card)
+            link_el = CARD_LINK_SELECTOR.select_one(card)
             if title_el and link_el:
                 url = link_el.get("href", "")
                 if url and not url.startswith("http"):
@@ -7,7 +7,13 @@ from app.dependencies import get_db
 from app.main import app
 
 
-@pytest.fixture(name="engine")
+@pytest.fixture(scope="session")
+def anyio_backend():
+    # The app only runs on asyncio; don't repeat async tests under trio
+    return "asyncio"
+
+
+@pytest.fixture(name="engine", scope="session")
 def engine_fixture():
     engine = create_engine(
         "sqlite://",
@@ -24,14 +30,26 @@ def session_fixture(engine):
     with Session(engine) as session:
         yield session
         session.rollback()
+    # The engine outlives the test, so empty the tables instead of recreating them
+    with engine.begin() as conn:
+        for table in reversed(SQLModel.metadata.sorted_tables):
+            conn.execute(table.delete())
+
+
+@pytest.fixture(name="app_client", scope="session")
+def app_client_fixture():
+    # Entering the client runs the app lifespan; do it once for the whole run
+    with TestClient(app) as client:
+        yield client
 
 
 @pytest.fixture(name="client")
-def client_fixture(session):
+def client_fixture(app_client, session):
     def _get_db_override():
         yield session
 
     app.dependency_overrides[get_db] = _get_db_override
-    with TestClient(app) as client:
-        yield client
-    app.dependency_overrides.clear()
+    try:
+        yield app_client
+    finally:
+        app.dependency_overrides.clear()
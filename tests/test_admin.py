@@ -18,12 +18,16 @@ def _set_admin(monkeypatch):
 import pytest
 
 
-@pytest.fixture(autouse=True)
-def _set_admin_password(monkeypatch):
-    monkeypatch.setenv("ADMIN_PASSWORD", ADMIN_PASS)
+@pytest.fixture(scope="module", autouse=True)
+def _set_admin_password():
     from app.config import get_settings
-    get_settings.cache_clear()
-    yield
+    from app.main import app
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("ADMIN_PASSWORD", ADMIN_PASS)
+        get_settings.cache_clear()
+        # The shared client's lifespan bound settings once; rebind them for this module
+        mp.setattr(app.state, "settings", get_settings(), raising=False)
+        yield
     get_settings.cache_clear()
 
 
@@ -32,6 +36,11 @@ def test_admin_without_credentials_returns_401(client):
     assert response.status_code == 401
 
 
+def test_admin_with_wrong_password_returns_401(client):
+    response = client.get("/admin/", auth=(ADMIN_USER, ADMIN_PASS + "x"))
+    assert response.status_code == 401
+
+
 def test_admin_with_valid_credentials_returns_200(client):
     response = client.get("/admin/", auth=(ADMIN_USER, ADMIN_PASS))
     assert response.status_code == 200
@@ -52,6 +61,7 @@ def test_admin_dashboard_shows_stats(client, session: Session):
     assert response.status_code == 200
     html = response.text
     assert ">1<" in html  # total events
+    assert "Last scrape: 2025-06-01" in html
 
 
 def test_admin_events_list(client, session: Session):
@@ -132,3 +142,38 @@ def test_nav_contains_runs_link(client):
     response = client.get("/admin/", auth=(ADMIN_USER, ADMIN_PASS))
     assert response.status_code == 200
     assert '/admin/runs' in response.text
+
+
+def test_admin_events_list_is_paginated(client, session: Session):
+    for i in range(3):
+        session.add(
+            Event(
+                external_id=f"evt-page-{i}",
+                title=f"Paged Event {i}",
+                url=f"https://example.com/page-{i}",
+                scraped_at=datetime(2025, 1, i + 1),
+            )
+        )
+    session.commit()
+
+    first = client.get("/admin/events?limit=2", auth=(ADMIN_USER, ADMIN_PASS))
+    assert "Paged Event 2" in first.text
+    assert "Paged Event 1" in first.text
+    assert "Paged Event 0" not in first.text
+    assert "offset=2" in first.text
+
+    second = client.get("/admin/events?limit=2&offset=2", auth=(ADMIN_USER, ADMIN_PASS))
+    assert "Paged Event 0" in second.text
+    assert "Paged Event 2" not in second.text
+    assert "Older" not in second.text
+    assert "offset=0" in second.text
+
+
+def test_parse_json_list_filter():
+    from app.routers.admin import _parse_json_list
+
+    assert _parse_json_list('["AI", "ML"]') == ["AI", "ML"]
+    assert _parse_json_list('["AI", "ML"]') is not _parse_json_list('["AI", "ML"]')
+    assert _parse_json_list("not json") == []
+    assert _parse_json_list('{"a": 1}') == []
+    assert _parse_json_list(None) == []
@@ -0,0 +1,31 @@
+import sqlalchemy
+from sqlalchemy.pool import StaticPool
+
+from app.database import migrate_db
+
+
+def test_migrate_db_adds_missing_columns_and_indexes():
+    engine = sqlalchemy.create_engine("sqlite://", poolclass=StaticPool)
+    with engine.begin() as conn:
+        conn.execute(
+            sqlalchemy.text(
+                "CREATE TABLE event (id INTEGER PRIMARY KEY, title TEXT, date DATETIME, scraped_at DATETIME)"
+            )
+        )
+        conn.execute(sqlalchemy.text("INSERT INTO event (title) VALUES ('Old')"))
+
+    migrate_db(engine)
+    migrate_db(engine)  # idempotent
+
+    inspector = sqlalchemy.inspect(engine)
+    columns = {c["name"] for c in inspector.get_columns("event")}
+    assert {"speakers", "organizer", "image_url", "reminder_sent"} <= columns
+    indexes = {i["name"] for i in inspector.get_indexes("event")}
+    assert {"ix_event_date", "ix_event_scraped_at"} <= indexes
+
+    with engine.connect() as conn:
+        row = conn.execute(
+            sqlalchemy.text("SELECT speakers, reminder_sent FROM event")
+        ).one()
+    assert row == ("[]", 0)
+    engine.dispose()
@@ -1,8 +1,19 @@
+import asyncio
+from contextlib import aclosing
+from functools import lru_cache
+
 import httpx
 import pytest
 from bs4 import BeautifulSoup
 
-from app.detail_fetcher import DetailFetcher
+from app.detail_fetcher import (
+    _MARKDOWN_CONVERTER,
+    HTML_TEXT_MAX_CHARS,
+    MARKDOWN_MAX_CHARS,
+    DetailFetcher,
+    _HostLimiter,
+    _parse_html,
+)
 
 # ── HTML fixtures ────────────────────────────────────────────────────────
 
@@ -55,13 +66,19 @@ HTML_FULL_PAGE = """
 """
 
 
+@lru_cache(maxsize=None)
+def _soup(html: str) -> BeautifulSoup:
+    """Parse a fixture once; only for tests that do not mutate the tree."""
+    return _parse_html(html)
+
+
 # ── JSON-LD tests ────────────────────────────────────────────────────────
 
 
 class TestExtractJsonLd:
     def test_extract_json_ld_event(self):
         fetcher = DetailFetcher()
-        soup = BeautifulSoup(HTML_JSON_LD_EVENT, "html.parser")
+        soup = _soup(HTML_JSON_LD_EVENT)
         result = fetcher._extract_json_ld(soup)
         assert result is not None
         assert result["@type"] == "Event"
@@ -69,26 +86,73 @@ class TestExtractJsonLd:
 
     def test_extract_json_ld_graph(self):
         fetcher = DetailFetcher()
-        soup = BeautifulSoup(HTML_JSON_LD_GRAPH, "html.parser")
+        soup = _soup(HTML_JSON_LD_GRAPH)
         result = fetcher._extract_json_ld(soup)
         assert result is not None
         assert result["@type"] == "Event"
         assert result["name"] == "Data Workshop"
 
+    def test_extract_json_ld_nested_event(self):
+        html = """
+        <html><head>
+        <script type="application/ld+json">{ not json </script>
+        <script type="application/ld+json">
+        [{"@type": "WebPage", "mainEntity": {"@type": "Event", "name": "Nested"}}]
+        </script>
+        </head><body></body></html>
+        """
+        fetcher = DetailFetcher()
+        soup = _soup(html)
+        result = fetcher._extract_json_ld(soup)
+        assert result == {"@type": "Event", "name": "Nested"}
+
     def test_extract_json_ld_missing(self):
         fetcher = DetailFetcher()
-        soup = BeautifulSoup(HTML_NO_JSON_LD, "html.parser")
+        soup = _soup(HTML_NO_JSON_LD)
         result = fetcher._extract_json_ld(soup)
         assert result is None
 
 
+# ── Blocked page detection ──────────────────────────────────────────────
+
+
+class TestIsBlocked:
+    def test_blocked_domain(self):
+        fetcher = DetailFetcher()
+        soup = _soup(HTML_JSON_LD_EVENT)
+        assert fetcher._is_blocked(soup, "https://www.linkedin.com/events/1", {"@type": "Event"})
+
+    def test_login_title(self):
+        html = "<html><head><title>Sign In | Example</title></head><body></body></html>"
+        fetcher = DetailFetcher()
+        soup = _soup(html)
+        assert fetcher._is_blocked(soup, "https://example.com/ev", {"@type": "Event"})
+
+    def test_short_page_without_json_ld(self):
+        fetcher = DetailFetcher()
+        soup = _soup(HTML_NO_JSON_LD)
+        assert fetcher._is_blocked(soup, "https://example.com/ev", None)
+
+    def test_long_page_without_json_ld_not_blocked(self):
+        html = "<html><body><main>" + "<p>Real content here.</p>" * 20 + "</main></body></html>"
+        fetcher = DetailFetcher()
+        soup = _soup(html)
+        assert not fetcher._is_blocked(soup, "https://example.com/ev", None)
+
+    def test_page_with_json_ld_not_blocked(self):
+        fetcher = DetailFetcher()
+        soup = _soup(HTML_JSON_LD_EVENT)
+        json_ld = fetcher._extract_json_ld(soup)
+        assert not fetcher._is_blocked(soup, "https://example.com/ev", json_ld)
+
+
 # ── OpenGraph tests ──────────────────────────────────────────────────────
 
 
 class TestExtractOgMeta:
     def test_extract_og_meta(self):
         fetcher = DetailFetcher()
-        soup = BeautifulSoup(HTML_OG_META, "html.parser")
+        soup = _soup(HTML_OG_META)
         result = fetcher._extract_og_meta(soup)
         assert result["og:title"] == "Test Event"
         assert result["og:description"] == "A great event"
@@ -96,7 +160,7 @@ class TestExtractOgMeta:
 
     def test_extract_og_meta_missing(self):
         fetcher = DetailFetcher()
-        soup = BeautifulSoup(HTML_NO_OG, "html.parser")
+        soup = _soup(HTML_NO_OG)
         result = fetcher._extract_og_meta(soup)
         assert result == {}
 
@@ -107,7 +171,7 @@ class TestExtractOgMeta:
 class TestHtmlToMarkdown:
     def test_html_to_markdown(self):
         fetcher = DetailFetcher()
-        soup = BeautifulSoup(HTML_FULL_PAGE, "html.parser")
+        soup = _parse_html(HTML_FULL_PAGE)
         result = fetcher._html_to_markdown(soup)
         assert "Event Title" in result
         assert "event description" in result
@@ -116,7 +180,7 @@ class TestHtmlToMarkdown:
 
     def test_html_to_markdown_strips_nav_footer(self):
         fetcher = DetailFetcher()
-        soup = BeautifulSoup(HTML_FULL_PAGE, "html.parser")
+        soup = _parse_html(HTML_FULL_PAGE)
         result = fetcher._html_to_markdown(soup)
         assert "Home" not in result  # nav removed
         assert "Copyright" not in result  # footer removed
@@ -128,10 +192,69 @@ class TestHtmlToMarkdown:
             + "</main></body></html>"
         )
         fetcher = DetailFetcher()
-        soup = BeautifulSoup(long_html, "html.parser")
+        soup = _parse_html(long_html)
         result = fetcher._html_to_markdown(soup)
         assert len(result) <= 3000
 
+    def test_html_to_markdown_pretruncates_large_pages(self, monkeypatch):
+        paragraphs = "".join(f"<p>Paragraph {i}</p>" for i in range(5000))
+        long_html = f"<html><body><main>{paragraphs}</main></body></html>"
+        converted: list[str] = []
+        convert = _MARKDOWN_CONVERTER.convert
+
+        def spy(html):
+            converted.append(html)
+            return convert(html)
+
+        monkeypatch.setattr(_MARKDOWN_CONVERTER, "convert", spy)
+        fetcher = DetailFetcher()
+        soup = _parse_html(long_html)
+        result = fetcher._html_to_markdown(soup)
+
+        text = BeautifulSoup(converted[0], "lxml").get_text()
+        assert len(text) <= HTML_TEXT_MAX_CHARS
+        assert result.startswith("Paragraph 0")
+        assert len(result) == MARKDOWN_MAX_CHARS
+
+    def test_html_to_markdown_ignores_comments_in_budget(self):
+        html = (
+            "<html><body><main><!--" + "c" * 4000 + "-->"
+            "<h1>Real heading</h1><p>Real body text</p></main></body></html>"
+        )
+        fetcher = DetailFetcher()
+        result = fetcher._html_to_markdown(_parse_html(html))
+        assert "Real heading" in result
+        assert "Real body text" in result
+
+    def test_html_to_markdown_trims_single_huge_text_node(self, monkeypatch):
+        html = "<html><body><main><p>" + "x" * 50000 + "</p></main></body></html>"
+        converted: list[str] = []
+        convert = _MARKDOWN_CONVERTER.convert
+
+        def spy(html):
+            converted.append(html)
+            return convert(html)
+
+        monkeypatch.setattr(_MARKDOWN_CONVERTER, "convert", spy)
+        fetcher = DetailFetcher()
+        result = fetcher._html_to_markdown(_parse_html(html))
+
+        text = BeautifulSoup(converted[0], "lxml").get_text()
+        assert len(text) == HTML_TEXT_MAX_CHARS
+        assert len(result) == MARKDOWN_MAX_CHARS
+
+    def test_html_to_markdown_fills_budget_on_markup_heavy_pages(self):
+        block = (
+            '<div class="card card--event flex flex-col items-start gap-4">'
+            '<svg viewBox="0 0 24 24"><path d="' + "M0 0L24 24" * 50 + '"/></svg>'
+            "<p>Paragraph {}</p></div>"
+        )
+        blocks = "".join(block.format(i) for i in range(1000))
+        fetcher = DetailFetcher()
+        soup = _parse_html(f"<html><body><main>{blocks}</main></body></html>")
+        result = fetcher._html_to_markdown(soup)
+        assert len(result) == MARKDOWN_MAX_CHARS
+
 
 # ── Concurrent fetch tests ──────────────────────────────────────────────
 
@@ -209,3 +332,159 @@ class TestFetchDetails:
         assert results[1]["title"] == "Fail Event"
 
         get_settings.cache_clear()
+
+
+class TestHostLimiter:
+    @pytest.mark.anyio
+    async def test_limits_requests_per_host(self):
+        limiter = _HostLimiter(total=10, per_host=1)
+        active: dict[str, int] = {}
+        peak: dict[str, int] = {}
+
+        async def hit(url, host):
+            async with limiter.slot(url):
+                active[host] = active.get(host, 0) + 1
+                peak[host] = max(peak.get(host, 0), active[host])
+                await asyncio.sleep(0.01)
+                active[host] -= 1
+
+        await asyncio.gather(
+            hit("https://a.example.com/1", "a"),
+            hit("https://a.example.com/2", "a"),
+            hit("https://b.example.com/1", "b"),
+        )
+
+        assert peak == {"a": 1, "b": 1}
+
+
+class TestIterDetails:
+    @pytest.mark.anyio
+    async def test_iter_details_yields_indexed_results(self, respx_mock):
+        url1 = "https://example.com/event1"
+        url2 = "https://example.org/event2"
+        respx_mock.get(url1).mock(return_value=httpx.Response(200, text=HTML_JSON_LD_EVENT))
+        respx_mock.get(url2).mock(return_value=httpx.Response(200, text=HTML_OG_META))
+
+        events = [
+            {"title": "Event 1", "url": url1},
+            {"title": "Event 2", "url": url2},
+        ]
+
+        fetcher = DetailFetcher()
+        results = {i: e async for i, e in fetcher.iter_details(events)}
+        await fetcher.aclose()
+
+        assert set(results) == {0, 1}
+        assert results[0]["json_ld"]["name"] == "AI Meetup"
+        assert results[1]["og_meta"]["og:title"] == "Test Event"
+
+    @pytest.mark.anyio
+    async def test_early_exit_cancels_pending_fetches(self, respx_mock, monkeypatch):
+        monkeypatch.setenv("SCRAPE_DETAIL_CONCURRENCY", "1")
+        from app.config import get_settings
+        get_settings.cache_clear()
+
+        async def slow(request):
+            await asyncio.sleep(0.01)
+            return httpx.Response(200, text=HTML_OG_META)
+
+        respx_mock.get("https://example.com/1").mock(
+            return_value=httpx.Response(200, text=HTML_JSON_LD_EVENT)
+        )
+        respx_mock.get("https://example.com/2").mock(side_effect=slow)
+        pending = [
+            respx_mock.get(f"https://example.com/{n}").mock(
+                return_value=httpx.Response(200, text=HTML_OG_META)
+            )
+            for n in (3, 4)
+        ]
+
+        events = [{"title": f"Event {n}", "url": f"https://example.com/{n}"} for n in range(1, 5)]
+        fetcher = DetailFetcher()
+        async with aclosing(fetcher.iter_details(events)) as details:
+            async for index, _ in details:
+                fetches = [
+                    task
+                    for task in asyncio.all_tasks()
+                    if "_fetch_group" in task.get_coro().__qualname__
+                ]
+                break
+        assert fetches and all(task.done() for task in fetches)
+        await asyncio.sleep(0.05)
+        await fetcher.aclose()
+
+        assert index == 0
+        assert [route.call_count for route in pending] == [0, 0]
+        get_settings.cache_clear()
+
+    @pytest.mark.anyio
+    async def test_duplicate_urls_fetched_once(self, respx_mock):
+        url = "https://example.com/recurring"
+        route = respx_mock.get(url).mock(
+            return_value=httpx.Response(200, text=HTML_JSON_LD_EVENT)
+        )
+
+        events = [
+            {"title": "Session 1", "url": url},
+            {"title": "Session 2", "url": url},
+        ]
+
+        fetcher = DetailFetcher()
+        results = await fetcher.fetch_details(events)
+        await fetcher.aclose()
+
+        assert route.call_count == 1
+        assert [r["title"] for r in results] == ["Session 1", "Session 2"]
+        assert results[1]["json_ld"]["name"] == "AI Meetup"
+
+    @pytest.mark.anyio
+    async def test_processing_error_isolated_to_one_page(self, respx_mock, monkeypatch):
+        url_ok = "https://example.com/ok"
+        url_bad = "https://example.org/bad"
+        respx_mock.get(url_ok).mock(return_value=httpx.Response(200, text=HTML_OG_META))
+        respx_mock.get(url_bad).mock(return_value=httpx.Response(200, text="<html></html>"))
+
+        fetcher = DetailFetcher()
+        parse_page = fetcher._parse_page
+
+        def flaky_parse(content):
+            if content == b"<html></html>":
+                raise ValueError("broken page")
+            return parse_page(content)
+
+        monkeypatch.setattr(fetcher, "_parse_page", flaky_parse)
+
+        results = await fetcher.fetch_details(
+            [{"title": "OK", "url": url_ok}, {"title": "Bad", "url": url_bad}]
+        )
+        await fetcher.aclose()
+
+        assert results[0]["og_meta"]["og:title"] == "Test Event"
+        assert results[1]["title"] == "Bad"
+        assert results[1]["json_ld"] is None
+        assert results[1]["markdown"] == ""
+
+    @pytest.mark.anyio
+    async def test_search_results_not_reused_across_runs(self, respx_mock, monkeypatch):
+        blocked = "https://www.linkedin.com/events/1"
+        alt_url = "https://lu.ma/ai-meetup"
+        respx_mock.get(blocked).mock(return_value=httpx.Response(200, text=HTML_NO_JSON_LD))
+        respx_mock.get(alt_url).mock(return_value=httpx.Response(200, text=HTML_JSON_LD_EVENT))
+
+        queries: list[str] = []
+
+        def fake_search(query):
+            queries.append(query)
+            return [{"href": alt_url}]
+
+        monkeypatch.setattr("app.detail_fetcher._web_search", fake_search)
+
+        events = [{"title": "AI Meetup", "url": blocked}]
+        fetcher = DetailFetcher()
+        first = await fetcher.fetch_details(events)
+        second = await fetcher.fetch_details(events)
+        await fetcher.aclose()
+
+        assert queries == ['"AI Meetup"', '"AI Meetup"']
+        assert first[0]["json_ld"]["name"] == "AI Meetup"
+        assert second[0]["json_ld"]["name"] == "AI Meetup"
@@ -21,9 +21,13 @@ BASE_URL = os.environ.get("BASE_URL", "http://localhost:8000")
 ADMIN_USER = os.environ.get("ADMIN_USERNAME", "admin")
 ADMIN_PASS = os.environ.get("ADMIN_PASSWORD", "")
 
-POLL_INTERVAL_SECONDS = 2
+POLL_INITIAL_SECONDS = 0.1
+POLL_MAX_INTERVAL_SECONDS = 2
 POLL_MAX_WAIT_SECONDS = 120
 
+RUN_ROW_RE = re.compile(r"<tr>\s*<td>(\d+)</td>")
+RUN_STATUS_RE = re.compile(r'badge-(\w+)">\w+</span>')
+
 
 @pytest.fixture(scope="module")
 def client():
@@ -42,17 +46,27 @@ def scrape_result():
     return {}
 
 
+@pytest.fixture(scope="module")
+def events_response(client):
+    """GET /events once, after the scrape steps; the checks below only read it."""
+    return client.get("/events")
+
+
 # ── Helpers ──────────────────────────────────────────────────────────────
 
 
-def count_runs(html: str) -> int:
-    """Count number of scrape run rows in the runs page HTML."""
-    return len(re.findall(r"<tr>\s*<td>\d+</td>", html))
+def get_latest_run_id(html: str) -> int:
+    """ID of the most recent (first) run row in the runs page HTML, 0 if none.
+
+    The runs page is paginated, so row counts stop growing past one page.
+    """
+    match = RUN_ROW_RE.search(html)
+    return int(match.group(1)) if match else 0
 
 
 def get_latest_run_status(html: str) -> str | None:
     """Extract the status of the most recent (first) run from runs page HTML."""
-    match = re.search(r'badge-(\w+)">\w+</span>', html)
+    match = RUN_STATUS_RE.search(html)
     return match.group(1) if match else None
 
 
@@ -85,11 +99,11 @@ class TestE2EWorkflow:
 
     # ── Scrape pipeline ─────────────────────────────────────────────
 
-    def test_04_count_runs_before(self, client, admin_auth, scrape_result):
-        """Record number of runs before triggering scrape."""
+    def test_04_latest_run_before(self, client, admin_auth, scrape_result):
+        """Record the latest run before triggering scrape."""
         r = client.get("/admin/runs", auth=admin_auth)
         assert r.status_code == 200
-        scrape_result["runs_before"] = count_runs(r.text)
+        scrape_result["run_before"] = get_latest_run_id(r.text)
 
     def test_05_trigger_scrape(self, client, admin_auth):
         """Trigger manual scrape via admin."""
@@ -104,21 +118,22 @@ class TestE2EWorkflow:
 
     def test_06_wait_for_scrape_completion(self, client, admin_auth, scrape_result):
         """Poll runs page until a new run finishes (success or failed)."""
-        runs_before = scrape_result.get("runs_before", 0)
+        run_before = scrape_result.get("run_before", 0)
         deadline = time.time() + POLL_MAX_WAIT_SECONDS
+        delay = POLL_INITIAL_SECONDS
 
         while time.time() < deadline:
-            r = client.get("/admin/runs", auth=admin_auth)
+            # Only the newest run matters; a one-row page keeps each poll small
+            r = client.get("/admin/runs", params={"limit": 1}, auth=admin_auth)
             html = r.text
-            current_runs = count_runs(html)
-
-            if current_runs > runs_before:
+            if get_latest_run_id(html) > run_before:
                 status = get_latest_run_status(html)
                 if status in ("success", "failed"):
                     scrape_result["status"] = status
                     scrape_result["html"] = html
                     break
-            time.sleep(POLL_INTERVAL_SECONDS)
+            time.sleep(delay)
+            delay = min(delay * 1.5, POLL_MAX_INTERVAL_SECONDS)
 
         assert "status" in scrape_result, (
             f"Scrape did not complete within {POLL_MAX_WAIT_SECONDS}s."
@@ -130,17 +145,15 @@ class TestE2EWorkflow:
 
     # ── Verify results ──────────────────────────────────────────────
 
-    def test_08_events_exist(self, client):
+    def test_08_events_exist(self, events_response):
         """Verify events API returns scraped events."""
-        r = client.get("/events")
-        assert r.status_code == 200
-        events = r.json()
+        assert events_response.status_code == 200
+        events = events_response.json()
         assert len(events) > 0
 
-    def test_09_events_have_structured_data(self, client):
+    def test_09_events_have_structured_data(self, events_response):
         """Verify at least some events have location, description, event_type."""
-        r = client.get("/events")
-        events = r.json()
+        events = events_response.json()
         assert len(events) > 0
 
         has_location = any(e.get("location") for e in events)
@@ -149,20 +162,18 @@ class TestE2EWorkflow:
 
         assert has_location or has_description or has_type
 
-    def test_10_events_data_quality(self, client):
+    def test_10_events_data_quality(self, events_response):
         """Verify data quality: URL validity."""
-        r = client.get("/events")
-        events = r.json()
+        events = events_response.json()
         assert len(events) > 0
 
         for event in events:
             url = event.get("url", "")
             assert url.startswith("http"), f"Invalid URL: {url}"
 
-    def test_11_events_api_returns_new_fields(self, client):
+    def test_11_events_api_returns_new_fields(self, events_response):
         """Verify events API returns speakers, organizer, image_url fields."""
-        r = client.get("/events")
-        events = r.json()
+        events = events_response.json()
         assert len(events) > 0
 
         first = events[0]
@@ -37,10 +37,11 @@ class TestGetEventIcal:
             description="A test event for iCal export",
         )
         session.add(event)
+        session.flush()  # assigns the primary key without a refresh round-trip
+        event_id = event.id
         session.commit()
-        session.refresh(event)
 
-        response = client.get(f"/events/{event.id}/ical")
+        response = client.get(f"/events/{event_id}/ical")
         assert response.status_code == 200
         assert response.headers["content-type"] == "text/calendar; charset=utf-8"
         content = response.content
@@ -48,6 +49,32 @@ class TestGetEventIcal:
         assert b"iCal Test Event" in content
         assert b"Prague" in content
 
+    def test_get_event_ical_not_modified(self, client, session) -> None:
+        event = Event(
+            external_id="ical-evt-etag",
+            title="Cached Event",
+            url="https://example.com/etag",
+            date=datetime(2025, 6, 15, 14, 0, 0),
+        )
+        session.add(event)
+        session.flush()  # assigns the primary key without a refresh round-trip
+        event_id = event.id
+        session.commit()
+
+        first = client.get(f"/events/{event_id}/ical")
+        etag = first.headers["etag"]
+
+        second = client.get(f"/events/{event_id}/ical", headers={"If-None-Match": etag})
+        assert second.status_code == 304
+        assert second.content == b""
+
+        event.scraped_at = datetime(2030, 1, 1)
+        session.add(event)
+        session.commit()
+        third = client.get(f"/events/{event_id}/ical", headers={"If-None-Match": etag})
+        assert third.status_code == 200
+        assert third.headers["etag"] != etag
+
     def test_get_event_ical_not_found(self, client) -> None:
         response = client.get("/events/999/ical")
         assert response.status_code == 404
@@ -62,3 +89,4 @@ class TestTriggerScrape:
         assert response.status_code == 200
         data = response.json()
         assert data["success"] is True
+        mock_pipeline.assert_awaited_once()
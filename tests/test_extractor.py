@@ -1,9 +1,16 @@
+import asyncio
 import json
 
 import httpx
 import pytest
 
-from app.extractor import EventExtractor, OPENAI_API_URL
+from app.config import Settings
+from app.extractor import (
+    OPENAI_API_URL,
+    EventExtractor,
+    close_openai_client,
+    get_openai_client,
+)
 
 
 SAMPLE_EVENTS = [
@@ -32,7 +39,7 @@ MOCK_OPENAI_RESPONSE = {
         {
             "message": {
                 "content": json.dumps(
-                    [
+                    {"events": [
                         {
                             "title": "AI Meetup",
                             "date": "2025-03-15",
@@ -48,7 +55,7 @@ MOCK_OPENAI_RESPONSE = {
                             "organizer": "DataTalk",
                             "image_url": "https://example.com/img.jpg",
                         }
-                    ]
+                    ]}
                 )
             }
         }
@@ -56,105 +63,161 @@ MOCK_OPENAI_RESPONSE = {
 }
 
 
+def _use_settings(monkeypatch, **overrides):
+    """Point the extractor at fixed settings without clearing the shared cache."""
+    settings = Settings(_env_file=None, **overrides)
+    monkeypatch.setattr("app.extractor.get_settings", lambda: settings)
+
+
 class TestExtractor:
+    @pytest.fixture(autouse=True)
+    async def _fresh_openai_client(self):
+        yield
+        await close_openai_client()
+
     @pytest.mark.anyio
     async def test_extract_without_api_key_uses_fallback(self, monkeypatch):
         """Without an API key, extractor uses fallback extraction from structured data."""
-        monkeypatch.setenv("OPENAI_API_KEY", "")
-        from app.config import get_settings
-
-        get_settings.cache_clear()
-        try:
-            extractor = EventExtractor()
-            result = await extractor.extract(SAMPLE_ENRICHED_EVENTS)
-            assert len(result) == 1
-            assert result[0]["title"] == "AI Meetup"
-            assert result[0]["url"] == "https://datatalk.cz/event/ai-meetup"
-            assert result[0]["date"] == "2025-03-15"
-            assert result[0]["image_url"] == "https://example.com/img.jpg"
-        finally:
-            get_settings.cache_clear()
+        _use_settings(monkeypatch, openai_api_key="")
+        extractor = EventExtractor()
+        result = await extractor.extract(SAMPLE_ENRICHED_EVENTS)
+        assert len(result) == 1
+        assert result[0]["title"] == "AI Meetup"
+        assert result[0]["url"] == "https://datatalk.cz/event/ai-meetup"
+        assert result[0]["date"] == "2025-03-15"
+        assert result[0]["image_url"] == "https://example.com/img.jpg"
 
     @pytest.mark.anyio
     async def test_extract_with_mock_openai(self, monkeypatch, respx_mock):
         """With a mocked OpenAI API, extractor returns parsed JSON."""
-        monkeypatch.setenv("OPENAI_API_KEY", "test-key-123")
-        from app.config import get_settings
+        _use_settings(monkeypatch, openai_api_key="test-key-123")
+        respx_mock.post(OPENAI_API_URL).mock(
+            return_value=httpx.Response(200, json=MOCK_OPENAI_RESPONSE)
+        )
 
-        get_settings.cache_clear()
-        try:
-            respx_mock.post(OPENAI_API_URL).mock(
-                return_value=httpx.Response(200, json=MOCK_OPENAI_RESPONSE)
-            )
-
-            extractor = EventExtractor()
-            result = await extractor.extract(SAMPLE_EVENTS)
+        extractor = EventExtractor()
+        result = await extractor.extract(SAMPLE_EVENTS)
 
-            assert len(result) == 1
-            assert result[0]["title"] == "AI Meetup"
-            assert result[0]["location"] == "Prague"
-            assert result[0]["topics"] == ["AI"]
-            assert result[0]["type"] == "meetup"
-            assert result[0]["speakers"] == ["Dr. Smith"]
-            assert result[0]["organizer"] == "DataTalk"
-            assert result[0]["image_url"] == "https://example.com/img.jpg"
-        finally:
-            get_settings.cache_clear()
+        assert len(result) == 1
+        assert result[0]["title"] == "AI Meetup"
+        assert result[0]["location"] == "Prague"
+        assert result[0]["topics"] == ["AI"]
+        assert result[0]["type"] == "meetup"
+        assert result[0]["speakers"] == ["Dr. Smith"]
+        assert result[0]["organizer"] == "DataTalk"
+        assert result[0]["image_url"] == "https://example.com/img.jpg"
 
     @pytest.mark.anyio
     async def test_extractor_formats_enriched_payload(self, monkeypatch, respx_mock):
         """Verify payload sent to OpenAI includes json_ld, og_meta, markdown."""
-        monkeypatch.setenv("OPENAI_API_KEY", "test-key-123")
-        from app.config import get_settings
+        _use_settings(monkeypatch, openai_api_key="test-key-123")
+        captured_request = {}
+
+        def capture_request(request):
+            captured_request["body"] = json.loads(request.content)
+            captured_request["content_type"] = request.headers["content-type"]
+            return httpx.Response(200, json=MOCK_OPENAI_RESPONSE)
+
+        respx_mock.post(OPENAI_API_URL).mock(side_effect=capture_request)
+
+        extractor = EventExtractor()
+        await extractor.extract(SAMPLE_ENRICHED_EVENTS)
+
+        # Check payload sent to OpenAI
+        assert captured_request["content_type"] == "application/json"
+        content = captured_request["body"]["messages"][0]["content"]
+        # The payload should contain json_ld, og_meta, markdown data
+        assert "json_ld" in content
+        assert "og_meta" in content
+        assert "AI Meetup" in content
+
+    @pytest.mark.anyio
+    async def test_extract_splits_events_into_batches(self, monkeypatch, respx_mock):
+        """Events beyond EXTRACT_BATCH_SIZE go out in separate JSON-mode requests."""
+        _use_settings(monkeypatch, openai_api_key="test-key-123")
+        monkeypatch.setattr("app.extractor.EXTRACT_BATCH_SIZE", 2)
+        bodies = []
 
-        get_settings.cache_clear()
-        try:
-            captured_request = {}
+        def reply(request):
+            body = json.loads(request.content)
+            bodies.append(body)
+            content = body["messages"][0]["content"]
+            titles = [t for t in ("Ev1", "Ev2", "Ev3") if t in content]
+            payload = {"events": [{"title": t} for t in titles]}
+            return httpx.Response(
+                200,
+                json={"choices": [{"message": {"content": json.dumps(payload)}}]},
+            )
+
+        respx_mock.post(OPENAI_API_URL).mock(side_effect=reply)
+
+        events = [{"title": t, "url": f"https://example.com/{t}"} for t in ("Ev1", "Ev2", "Ev3")]
+        result = await EventExtractor().extract(events)
+
+        assert [e["title"] for e in result] == ["Ev1", "Ev2", "Ev3"]
+        assert len(bodies) == 2
+        assert all(b["response_format"] == {"type": "json_object"} for b in bodies)
 
-            def capture_request(request):
-                captured_request["body"] = json.loads(request.content)
-                return httpx.Response(200, json=MOCK_OPENAI_RESPONSE)
+    @pytest.mark.anyio
+    async def test_extract_sends_batches_concurrently(self, monkeypatch, respx_mock):
+        """Batches overlap in flight, up to OPENAI_CONCURRENCY at a time."""
+        _use_settings(monkeypatch, openai_api_key="test-key-123", openai_concurrency=2)
+        monkeypatch.setattr("app.extractor.EXTRACT_BATCH_SIZE", 1)
+        in_flight = 0
+        peak = 0
+
+        async def reply(request):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            payload = {"events": [{"title": "Ev"}]}
+            return httpx.Response(
+                200,
+                json={"choices": [{"message": {"content": json.dumps(payload)}}]},
+            )
 
-            respx_mock.post(OPENAI_API_URL).mock(side_effect=capture_request)
+        route = respx_mock.post(OPENAI_API_URL).mock(side_effect=reply)
 
-            extractor = EventExtractor()
-            await extractor.extract(SAMPLE_ENRICHED_EVENTS)
+        events = [{"title": f"Ev{i}", "url": f"https://example.com/{i}"} for i in range(4)]
+        result = await EventExtractor().extract(events)
 
-            # Check payload sent to OpenAI
-            content = captured_request["body"]["messages"][0]["content"]
-            # The payload should contain json_ld, og_meta, markdown data
-            assert "json_ld" in content
-            assert "og_meta" in content
-            assert "AI Meetup" in content
-        finally:
-            get_settings.cache_clear()
+        assert len(result) == 4
+        assert route.call_count == 4
+        assert peak == 2
 
     @pytest.mark.anyio
     async def test_extractor_handles_missing_detail_data(self, monkeypatch, respx_mock):
         """Events without detail data (no json_ld, og_meta, markdown) don't break extraction."""
-        monkeypatch.setenv("OPENAI_API_KEY", "test-key-123")
-        from app.config import get_settings
-
-        get_settings.cache_clear()
-        try:
-            # Events without any detail enrichment
-            plain_events = [
-                {
-                    "title": "Plain Event",
-                    "url": "https://example.com/plain",
-                }
-            ]
-
-            respx_mock.post(OPENAI_API_URL).mock(
-                return_value=httpx.Response(200, json=MOCK_OPENAI_RESPONSE)
-            )
+        _use_settings(monkeypatch, openai_api_key="test-key-123")
+        # Events without any detail enrichment
+        plain_events = [
+            {
+                "title": "Plain Event",
+                "url": "https://example.com/plain",
+            }
+        ]
+
+        respx_mock.post(OPENAI_API_URL).mock(
+            return_value=httpx.Response(200, json=MOCK_OPENAI_RESPONSE)
+        )
+
+        extractor = EventExtractor()
+        result = await extractor.extract(plain_events)
+
+        assert len(result) == 1
+
 
-            extractor = EventExtractor()
-            result = await extractor.extract(plain_events)
+@pytest.mark.anyio
+async def test_openai_client_is_reused_until_closed():
+    client = get_openai_client()
+    assert get_openai_client() is client
 
-            assert len(result) == 1
-        finally:
-            get_settings.cache_clear()
+    await close_openai_client()
+    assert client.is_closed
+    assert get_openai_client() is not client
+    await close_openai_client()
 
 
 class TestFallbackExtraction:
@@ -0,0 +1,90 @@
+from unittest.mock import MagicMock, patch
+
+from app.google_calendar import sync_events_to_google_calendar
+from app.models import Event
+
+
+class FakeBatch:
+    """Stands in for BatchHttpRequest: records requests, answers all on execute()."""
+
+    def __init__(self, callback, failing=()):
+        self.callback = callback
+        self.failing = set(failing)
+        self.request_ids = []
+
+    def add(self, request, request_id):
+        self.request_ids.append(request_id)
+
+    def execute(self):
+        for request_id in self.request_ids:
+            error = RuntimeError("boom") if request_id in self.failing else None
+            self.callback(request_id, None if error else {"id": "gcal"}, error)
+
+
+def _make_service(pages, failing=()):
+    service = MagicMock()
+    service.events.return_value.list.return_value.execute.side_effect = pages
+    service.batches = []
+
+    def new_batch(callback):
+        batch = FakeBatch(callback, failing)
+        service.batches.append(batch)
+        return batch
+
+    service.new_batch_http_request.side_effect = new_batch
+    return service
+
+
+def _sync(service, events):
+    with (
+        patch("app.google_calendar.get_settings") as mock_settings,
+        patch("app.google_calendar._get_service", return_value=service),
+    ):
+        mock_settings.return_value.google_calendar_id = "cal"
+        mock_settings.return_value.google_service_account_json = "{}"
+        return sync_events_to_google_calendar(events)
+
+
+def test_sync_looks_up_existing_events_once():
+    """Existing events are resolved from one paged listing, not one query per event."""
+    service = _make_service(
+        [
+            {
+                "items": [
+                    {"id": "gcal-1", "extendedProperties": {"private": {"datatalk_external_id": "ext-1"}}},
+                ],
+                "nextPageToken": "page-2",
+            },
+            {"items": [{"id": "unrelated"}]},
+        ]
+    )
+    events = [
+        Event(external_id="ext-1", title="Known", url="https://example.com/1"),
+        Event(external_id="ext-2", title="New", url="https://example.com/2"),
+    ]
+
+    synced = _sync(service, events)
+
+    assert synced == 2
+    assert service.events.return_value.list.call_count == 2
+    update_kwargs = service.events.return_value.update.call_args.kwargs
+    assert update_kwargs["eventId"] == "gcal-1"
+    service.events.return_value.insert.assert_called_once()
+
+
+def test_sync_sends_requests_in_batches(monkeypatch):
+    monkeypatch.setattr("app.google_calendar.GCAL_BATCH_SIZE", 2)
+    service = _make_service([{"items": []}], failing={"ext-1"})
+    events = [
+        Event(external_id=f"ext-{i}", title=f"Event {i}", url=f"https://example.com/{i}")
+        for i in range(5)
+    ]
+
+    synced = _sync(service, events)
+
+    assert [b.request_ids for b in service.batches] == [
+        ["ext-0", "ext-1"],
+        ["ext-2", "ext-3"],
+        ["ext-4"],
+    ]
+    assert synced == 4
@@ -1,25 +1,22 @@
 from datetime import datetime, timedelta
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
-from sqlalchemy.pool import StaticPool
-from sqlmodel import Session, SQLModel, create_engine, select
+import sqlalchemy
+from sqlmodel import select
 
 from app.models import Event, ScrapeRun, ScrapeRunStatus
-from app.notifications.pipeline import run_scrape_and_sync, send_event_reminders
+from app.notifications.pipeline import (
+    _external_id,
+    run_scrape_and_sync,
+    send_event_reminders,
+)
 
 
 @pytest.fixture(name="pipeline_session")
-def pipeline_session_fixture():
-    engine = create_engine(
-        "sqlite://",
-        connect_args={"check_same_thread": False},
-        poolclass=StaticPool,
-    )
-    SQLModel.metadata.create_all(engine)
-    with Session(engine) as session:
-        yield session
-    engine.dispose()
+def pipeline_session_fixture(session):
+    # The shared test engine already has the schema; conftest empties it per test
+    return session
 
 
 # Future date for events
@@ -41,11 +38,13 @@ def _make_mocks(raw_events, enriched_events):
 
 
 def _pipeline_patches(mock_scraper, mock_detail_fetcher, mock_extractor):
-    return (
-        patch("app.notifications.pipeline.Scraper", return_value=mock_scraper),
-        patch("app.notifications.pipeline.DetailFetcher", return_value=mock_detail_fetcher),
-        patch("app.notifications.pipeline.EventExtractor", return_value=mock_extractor),
-        patch("app.notifications.pipeline.sync_events_to_google_calendar", return_value=1),
+    """Swap every pipeline collaborator in one patch.multiple context."""
+    return patch.multiple(
+        "app.notifications.pipeline",
+        Scraper=MagicMock(return_value=mock_scraper),
+        DetailFetcher=MagicMock(return_value=mock_detail_fetcher),
+        EventExtractor=MagicMock(return_value=mock_extractor),
+        sync_events_to_google_calendar=MagicMock(return_value=1),
     )
 
 
@@ -112,7 +111,7 @@ async def test_pipeline_no_events(pipeline_session):
 
     with (
         patch("app.notifications.pipeline.Scraper", return_value=mock_scraper),
-        patch("app.notifications.pipeline.DetailFetcher"),
+        patch("app.notifications.pipeline.DetailFetcher", return_value=AsyncMock()),
     ):
         await run_scrape_and_sync(pipeline_session)
 
@@ -134,7 +133,7 @@ async def test_pipeline_creates_scrape_run_on_failure(pipeline_session):
 
     with (
         patch("app.notifications.pipeline.Scraper", return_value=mock_scraper),
-        patch("app.notifications.pipeline.DetailFetcher"),
+        patch("app.notifications.pipeline.DetailFetcher", return_value=AsyncMock()),
         pytest.raises(RuntimeError, match="scrape failed"),
     ):
         await run_scrape_and_sync(pipeline_session)
@@ -155,37 +154,33 @@ async def test_pipeline_calls_detail_fetcher(pipeline_session):
     ]
 
     mock_scraper, mock_detail_fetcher, mock_extractor = _make_mocks(raw_events, enriched_events)
-    p = _pipeline_patches(mock_scraper, mock_detail_fetcher, mock_extractor)
-
-    with p[0], p[1], p[2], p[3]:
+    with _pipeline_patches(mock_scraper, mock_detail_fetcher, mock_extractor):
         await run_scrape_and_sync(pipeline_session)
 
     mock_detail_fetcher.fetch_details.assert_called_once_with(raw_events)
+    mock_detail_fetcher.aclose.assert_awaited_once()
+    mock_scraper.aclose.assert_awaited_once()
     mock_extractor.extract.assert_called_once()
 
 
 @pytest.mark.anyio
 async def test_pipeline_upserts_events(pipeline_session):
     """Verify existing events are updated (not duplicated) on re-scrape."""
-    import hashlib
     url = "https://example.com/existing"
-    ext_id = hashlib.md5(url.encode()).hexdigest()[:16]
     old_event = Event(
-        external_id=ext_id,
+        external_id=_external_id(url),
         title="Old Title",
         url=url,
         location="Old Location",
     )
     pipeline_session.add(old_event)
-    pipeline_session.commit()
+    pipeline_session.flush()
 
     raw_events = [{"title": "New Title", "url": url}]
     enriched_events = [{"title": "New Title", "url": url, "location": "New Location", "type": "meetup"}]
 
     mock_scraper, mock_detail_fetcher, mock_extractor = _make_mocks(raw_events, enriched_events)
-    p = _pipeline_patches(mock_scraper, mock_detail_fetcher, mock_extractor)
-
-    with p[0], p[1], p[2], p[3]:
+    with _pipeline_patches(mock_scraper, mock_detail_fetcher, mock_extractor):
         await run_scrape_and_sync(pipeline_session)
 
     events_after = pipeline_session.exec(select(Event)).all()
@@ -194,6 +189,50 @@ async def test_pipeline_upserts_events(pipeline_session):
     assert events_after[0].location == "New Location"
 
 
+@pytest.mark.anyio
+async def test_pipeline_duplicate_urls_in_batch(pipeline_session):
+    """The same URL twice in one batch yields one event, updated by the later entry."""
+    url = "https://example.com/dup"
+    raw_events = [{"title": "First", "url": url}, {"title": "Second", "url": url}]
+    enriched_events = [
+        {"title": "First", "url": url, "type": "meetup"},
+        {"title": "Second", "url": url, "type": "meetup"},
+    ]
+
+    mock_scraper, mock_detail_fetcher, mock_extractor = _make_mocks(raw_events, enriched_events)
+    with _pipeline_patches(mock_scraper, mock_detail_fetcher, mock_extractor):
+        await run_scrape_and_sync(pipeline_session)
+
+    events = pipeline_session.exec(select(Event)).all()
+    assert len(events) == 1
+    assert events[0].title == "Second"
+
+
+@pytest.mark.anyio
+async def test_pipeline_inserts_new_events_in_one_statement(pipeline_session):
+    """New events go out as one multi-row INSERT, not one INSERT per event."""
+    raw_events = [{"title": f"Ev{i}", "url": f"https://example.com/bulk-{i}"} for i in range(50)]
+    enriched_events = [dict(e, type="meetup") for e in raw_events]
+
+    inserts = []
+
+    def count_inserts(conn, cursor, statement, parameters, context, executemany):
+        if statement.startswith("INSERT INTO event"):
+            inserts.append(statement)
+
+    engine = pipeline_session.get_bind()
+    sqlalchemy.event.listen(engine, "before_cursor_execute", count_inserts)
+    mock_scraper, mock_detail_fetcher, mock_extractor = _make_mocks(raw_events, enriched_events)
+    try:
+        with _pipeline_patches(mock_scraper, mock_detail_fetcher, mock_extractor):
+            await run_scrape_and_sync(pipeline_session)
+    finally:
+        sqlalchemy.event.remove(engine, "before_cursor_execute", count_inserts)
+
+    assert len(inserts) == 1
+    assert len(pipeline_session.exec(select(Event)).all()) == 50
+
+
 @pytest.mark.anyio
 async def test_pipeline_saves_new_fields(pipeline_session):
     """Verify speakers, organizer, image_url are saved to Event."""
@@ -212,9 +251,7 @@ async def test_pipeline_saves_new_fields(pipeline_session):
     ]
 
     mock_scraper, mock_detail_fetcher, mock_extractor = _make_mocks(raw_events, enriched_events)
-    p = _pipeline_patches(mock_scraper, mock_detail_fetcher, mock_extractor)
-
-    with p[0], p[1], p[2], p[3]:
+    with _pipeline_patches(mock_scraper, mock_detail_fetcher, mock_extractor):
         await run_scrape_and_sync(pipeline_session)
 
     events = pipeline_session.exec(select(Event)).all()
@@ -237,7 +274,7 @@ async def test_event_reminder_sends_to_channel(pipeline_session):
         date=now + timedelta(hours=2),
     )
     pipeline_session.add(event)
-    pipeline_session.commit()
+    pipeline_session.flush()
 
     mock_telegram = AsyncMock()
     mock_telegram.send_to_channel.return_value = True
@@ -264,7 +301,7 @@ async def test_event_reminder_not_sent_twice(pipeline_session):
         reminder_sent=True,
     )
     pipeline_session.add(event)
-    pipeline_session.commit()
+    pipeline_session.flush()
 
     mock_telegram = AsyncMock()
 
@@ -285,7 +322,7 @@ async def test_event_reminder_skips_distant_events(pipeline_session):
         date=now + timedelta(hours=5),
     )
     pipeline_session.add(event)
-    pipeline_session.commit()
+    pipeline_session.flush()
 
     mock_telegram = AsyncMock()
 
@@ -1,5 +1,6 @@
 import httpx
 import pytest
+from tenacity import wait_none
 
 from app.scraper import Scraper
 
@@ -75,8 +76,10 @@ class TestParseEvents:
 
 class TestFetchPage:
     @pytest.mark.anyio
-    async def test_fetch_page_retries_on_500(self, respx_mock):
+    async def test_fetch_page_retries_on_500(self, respx_mock, monkeypatch):
         """Mock httpx to fail twice with 500, then succeed on third attempt."""
+        # Keep the retry policy but skip its real backoff sleeps
+        monkeypatch.setattr(Scraper.fetch_page.retry, "wait", wait_none())
         url = "https://example.com/events"
 
         route = respx_mock.get(url)
@@ -84,10 +87,16 @@ class TestFetchPage:
             httpx.Response(500),
             httpx.Response(500),
             httpx.Response(200, text="<html>OK</html>"),
+            httpx.Response(200, text="<html>OK</html>"),
         ]
 
         scraper = Scraper()
         result = await scraper.fetch_page(url)
+        client = scraper._client
+        await scraper.fetch_page(url)
 
         assert result == "<html>OK</html>"
-        assert route.call_count == 3
+        assert route.call_count == 4
+        assert scraper._client is client  # retries and later calls share one client
+        await scraper.aclose()
+        assert client.is_closed
@@ -1,10 +1,17 @@
+from datetime import datetime
 from unittest.mock import patch
 
 import httpx
 import pytest
 import respx
 
-from app.notifications.telegram import TelegramNotifier
+from app.models import Event
+from app.notifications.telegram import (
+    TelegramNotifier,
+    close_telegram_client,
+    format_event_reminder,
+    get_telegram_client,
+)
 
 
 @pytest.mark.anyio
@@ -24,11 +31,15 @@ async def test_telegram_sends_to_channel():
         notifier = TelegramNotifier()
         result = await notifier.send_to_channel("Hello from test")
 
+    await close_telegram_client()
+
     assert result is True
     assert route.called
     request = route.calls[0].request
     assert b"@test_channel" in request.content
     assert b"Hello from test" in request.content
+    assert b'"parse_mode":"HTML"' in request.content
+    assert request.headers["content-type"] == "application/json"
 
 
 @pytest.mark.anyio
@@ -44,3 +55,47 @@ async def test_telegram_skips_without_token():
         result = await notifier.send_to_channel("Hello")
 
     assert result is False
+
+
+@pytest.mark.anyio
+async def test_telegram_client_is_reused_until_closed():
+    client = get_telegram_client()
+    assert get_telegram_client() is client
+
+    await close_telegram_client()
+    assert client.is_closed
+    assert get_telegram_client() is not client
+    await close_telegram_client()
+
+
+def test_format_event_reminder():
+    events = [
+        Event(
+            external_id="r-1",
+            title="AI Meetup",
+            url="https://example.com/ai",
+            date=datetime(2025, 6, 1, 18, 30),
+            location="Praha",
+            speakers='["Alice", "Bob"]',
+            description="Talks about AI.",
+        ),
+        Event(external_id="r-2", title="Online Talk", url="https://example.com/talk"),
+    ]
+
+    text = format_event_reminder(events)
+
+    assert text == (
+        "<b>Za 2 hodiny:</b>\n\n"
+        "<b>AI Meetup</b>\nCas: 18:30\nPraha\nSpeakers: Alice, Bob\nTalks about AI.\n"
+        '<a href="https://example.com/ai">Vice info</a>\n\n'
+        '<b>Online Talk</b>\nTBD\n<a href="https://example.com/talk">Vice info</a>'
+    )
+
+
+def test_format_event_reminder_escapes_html():
+    event = Event(external_id="r-3", title="R&D <Night>", url="https://example.com/?a=1&b=2")
+
+    text = format_event_reminder([event])
+
+    assert "<b>R&amp;D &lt;Night&gt;</b>" in text
+    assert 'href="https://example.com/?a=1&amp;b=2"' in text